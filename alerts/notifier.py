@@ -1,24 +1,391 @@
 import os
+import atexit
+import functools
+import html
 import smtplib
 import json
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import queue
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Callable, Tuple
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Prefer orjson for webhook payloads, fall back to the stdlib encoder
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Recycle the pooled SMTP connection after this many messages; providers
+# throttle or drop long-lived sessions that send too much
+MAX_MSGS_PER_CONN = 100
+
+# Queued trend alerts are collected for up to this many seconds (or items)
+# and deduplicated per entity/platform before being sent
+ALERT_BATCH_WINDOW = 0.5
+ALERT_BATCH_MAX = 50
+
+# Message templates, rendered with str.format_map
+TREND_ALERT_TEXT = """
+Social Media RAG Alert
+
+Entity: {entity}
+Platform: {platform_title}
+Trend Score: {trend_score:.2f}σ
+Current Mentions: {current_count:,}
+Growth Rate: {growth_rate:.1%}
+Alert Type: {alert_type_title}
+
+Time: {time}
+
+This topic is trending significantly above normal levels. 
+Check the dashboard for more details: http://localhost:5000
+
+---
+Social Media RAG System
+"""
+
+TREND_ALERT_HTML = """
+<html>
+<body>
+    <h2>🚨 Social Media RAG Alert</h2>
+    
+    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0;">
+        <h3>{entity}</h3>
+        <table style="width: 100%; border-collapse: collapse;">
+            <tr>
+                <td style="padding: 8px; font-weight: bold;">Platform:</td>
+                <td style="padding: 8px;">{platform_title}</td>
+            </tr>
+            <tr>
+                <td style="padding: 8px; font-weight: bold;">Trend Score:</td>
+                <td style="padding: 8px; color: #dc3545;"><strong>{trend_score:.2f}σ</strong></td>
+            </tr>
+            <tr>
+                <td style="padding: 8px; font-weight: bold;">Current Mentions:</td>
+                <td style="padding: 8px;">{current_count:,}</td>
+            </tr>
+            <tr>
+                <td style="padding: 8px; font-weight: bold;">Growth Rate:</td>
+                <td style="padding: 8px;">{growth_rate:.1%}</td>
+            </tr>
+            <tr>
+                <td style="padding: 8px; font-weight: bold;">Alert Type:</td>
+                <td style="padding: 8px;">{alert_type_title}</td>
+            </tr>
+        </table>
+    </div>
+    
+    <p><strong>Time:</strong> {time}</p>
+    
+    <p>This topic is trending significantly above normal levels.</p>
+    
+    <p><a href="http://localhost:5000" style="background-color: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 4px;">View Dashboard</a></p>
+    
+    <hr style="margin-top: 30px;">
+    <p style="color: #666; font-size: 12px;">Social Media RAG System</p>
+</body>
+</html>
+"""
+
+SYSTEM_ALERT_TEXT = """
+System Alert
+
+Severity: {severity}
+Message: {message}
+Time: {time}
+
+---
+Social Media RAG System
+"""
+
+DIGEST_TEXT = """
+{period_title} Trending Topics Digest
+
+Top {count} trending topics:
+
+{items}
+Generated: {time}
+
+View full dashboard: http://localhost:5000
+
+---
+Social Media RAG System
+"""
+
+DIGEST_TEXT_ITEM = """{rank}. {entity} ({platform})
+   Score: {score_str} | Mentions: {mentions_str}
+
+"""
+
+DIGEST_HTML = """
+<html>
+<body>
+    <h2>📊 {period_title} Trending Topics Digest</h2>
+    
+    <p>Top {count} trending topics:</p>
+    
+    <ol>
+{items}
+    </ol>
+    
+    <p><strong>Generated:</strong> {time}</p>
+    
+    <p><a href="http://localhost:5000" style="background-color: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 4px;">View Full Dashboard</a></p>
+    
+    <hr>
+    <p style="color: #666; font-size: 12px;">Social Media RAG System</p>
+</body>
+</html>
+"""
+
+DIGEST_HTML_ITEM = """
+        <li>
+            <strong>{entity}</strong> 
+            <span style="color: #666;">({platform})</span>
+            <br>
+            <small>
+                Score: <strong>{score_str}</strong> | 
+                Mentions: <strong>{mentions_str}</strong>
+            </small>
+        </li>
+"""
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a webhook payload to JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data).encode('utf-8')
+
+@functools.lru_cache(maxsize=1)
+def _notifier_settings() -> Dict[str, Any]:
+    """Resolve notifier settings from the environment once per process"""
+    return {
+        'smtp_server': os.getenv('ALERT_EMAIL_SMTP', 'smtp.gmail.com'),
+        'email_user': os.getenv('ALERT_EMAIL_USER'),
+        'email_pass': os.getenv('ALERT_EMAIL_PASS'),
+        'email_to': os.getenv('ALERT_EMAIL_TO'),
+        'webhook_url': os.getenv('ALERT_WEBHOOK_URL')
+    }
+
+class _TLSAdapter(HTTPAdapter):
+    """HTTPAdapter that uses one shared SSLContext for every HTTPS pool"""
+    
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+    
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        if verify is True:
+            pool_kwargs['ssl_context'] = self._ssl_context
+        return host_params, pool_kwargs
 
 class AlertNotifier:
     """Handles sending notifications for trend alerts"""
     
+    _SEVERITY_EMOJIS = MappingProxyType({
+        'info': 'ℹ️',
+        'warning': '⚠️',
+        'error': '❌',
+        'critical': '🚨'
+    })
+    
+    # Static request parts shared by every webhook call
+    _JSON_HEADERS = MappingProxyType({'Content-Type': 'application/json'})
+    _DISCORD_BASE = MappingProxyType({'username': 'Social Media RAG Alerts'})
+    
     def __init__(self):
-        self.smtp_server = os.getenv('ALERT_EMAIL_SMTP', 'smtp.gmail.com')
+        settings = _notifier_settings()
+        self.smtp_server = settings['smtp_server']
         self.smtp_port = 587
-        self.email_user = os.getenv('ALERT_EMAIL_USER')
-        self.email_pass = os.getenv('ALERT_EMAIL_PASS')
-        self.email_to = os.getenv('ALERT_EMAIL_TO')
-        self.webhook_url = os.getenv('ALERT_WEBHOOK_URL')
+        self.email_user = settings['email_user']
+        self.email_pass = settings['email_pass']
+        self.email_to = settings['email_to']
+        self.webhook_url = settings['webhook_url']
+        # Channels without configuration are skipped before any message is built
+        self._email_ok = all([self.email_user, self.email_pass, self.email_to])
+        self._webhook_ok = bool(self.webhook_url)
+        self._session = self._create_session()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='alert-notifier')
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_sent = 0
+        self._smtp_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+    
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session so webhook calls reuse TCP/TLS connections"""
+        session = requests.Session()
+        
+        # One context for all webhook hosts: CA certs are loaded once and
+        # session tickets stay enabled for servers that offer them
+        ssl_context = ssl.create_default_context()
+        ssl_context.options &= ~ssl.OP_NO_TICKET
+        
+        adapter = _TLSAdapter(
+            ssl_context,
+            pool_connections=10,
+            pool_maxsize=50,
+            # Webhooks are POSTs, which urllib3 does not retry unless allowed
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=frozenset([429, 500, 502, 503, 504]),
+                allowed_methods=frozenset(['POST']),
+                respect_retry_after_header=True
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _dispatch(self, *senders: Callable[[], bool]) -> bool:
+        """
+        Run notification senders concurrently
         
+        Args:
+            senders: Zero-argument callables, one per notification channel
+            
+        Returns:
+            True if any sender succeeded
+        """
+        futures = [self._executor.submit(sender) for sender in senders]
+        return any([future.result() for future in futures])
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """
+        Get the pooled SMTP connection, reconnecting when it is missing,
+        has hit MAX_MSGS_PER_CONN, or no longer answers NOOP.
+        Callers must hold self._smtp_lock.
+        """
+        if self._smtp is not None and self._smtp_sent < MAX_MSGS_PER_CONN:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+        
+        self._close_smtp()
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
+        server.starttls()
+        server.login(self.email_user, self.email_pass)
+        self._smtp = server
+        self._smtp_sent = 0
+        return server
+    
+    def _close_smtp(self):
+        """Close the pooled SMTP connection if one is open"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+    
+    def _ensure_worker(self):
+        """Start the background alert queue worker if it is not running"""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._drain_queue,
+                    name='alert-queue',
+                    daemon=True
+                )
+                self._worker.start()
+    
+    def _drain_queue(self):
+        """Worker loop: collect queued alerts into short batches and send them"""
+        stopping = False
+        
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                return
+            
+            batch = [item]
+            deadline = time.monotonic() + ALERT_BATCH_WINDOW
+            while len(batch) < ALERT_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            alerts = self._coalesce_alerts(batch)
+            try:
+                # The last batch is flushed from close(), which runs at exit after
+                # concurrent.futures has stopped accepting work, so send it inline
+                self.send_trend_alerts(alerts, concurrent=not stopping)
+            except RuntimeError:
+                # Interpreter shutdown began mid-batch and the executor refused it
+                try:
+                    self.send_trend_alerts(alerts, concurrent=False)
+                except Exception as e:
+                    logger.error("Failed to send queued alerts: %s", e)
+            except Exception as e:
+                logger.error("Failed to send queued alerts: %s", e)
+    
+    @staticmethod
+    def _coalesce_alerts(batch: List[Tuple[Dict[str, Any], str]]) -> List[Tuple[Dict[str, Any], str]]:
+        """Keep one alert per (entity, platform), the one with the highest trend score"""
+        strongest: Dict[Tuple[Any, Any], Tuple[Dict[str, Any], str]] = {}
+        
+        for trend_data, alert_type in batch:
+            key = (trend_data.get('entity'), trend_data.get('platform'))
+            current = strongest.get(key)
+            if current is None or (trend_data.get('trend_score') or 0) > (current[0].get('trend_score') or 0):
+                strongest[key] = (trend_data, alert_type)
+        
+        return list(strongest.values())
+    
+    def close(self):
+        """Flush queued alerts and release pooled HTTP/SMTP connections and worker threads"""
+        with self._worker_lock:
+            worker = self._worker
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join()
+        
+        self._executor.shutdown(wait=True)
+        self._session.close()
+        with self._smtp_lock:
+            self._close_smtp()
+        
+    def _build_message(self, subject: str, body: str, html_body: str = None) -> EmailMessage:
+        """Build an email with a plain text part and optional HTML alternative"""
+        msg = EmailMessage()
+        msg['Subject'] = subject
+        msg['From'] = self.email_user
+        msg['To'] = self.email_to
+        
+        # Plain text body, upgraded to multipart/alternative when HTML is given
+        msg.set_content(body)
+        if html_body:
+            msg.add_alternative(html_body, subtype='html')
+        
+        return msg
+    
     def send_email(self, subject: str, body: str, html_body: str = None) -> bool:
         """
         Send email notification
@@ -31,38 +398,69 @@ class AlertNotifier:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            if not all([self.email_user, self.email_pass, self.email_to]):
-                logging.warning("Email credentials not configured")
-                return False
-            
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = self.email_user
-            msg['To'] = self.email_to
-            
-            # Add plain text part
-            text_part = MIMEText(body, 'plain')
-            msg.attach(text_part)
-            
-            # Add HTML part if provided
-            if html_body:
-                html_part = MIMEText(html_body, 'html')
-                msg.attach(html_part)
-            
-            # Connect and send
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_user, self.email_pass)
-                server.send_message(msg)
-            
-            logging.info(f"Email sent successfully to {self.email_to}")
-            return True
+        return self.send_emails([(subject, body, html_body)])[0]
+    
+    def send_emails(self, messages: List[Tuple[str, str, Optional[str]]]) -> List[bool]:
+        """
+        Send several emails over a single authenticated SMTP session
+        
+        Args:
+            messages: List of (subject, body, html_body) tuples
             
-        except Exception as e:
-            logging.error(f"Failed to send email: {str(e)}")
-            return False
+        Returns:
+            List with a success flag for each message
+        """
+        if not all([self.email_user, self.email_pass, self.email_to]):
+            logger.warning("Email credentials not configured")
+            return [False] * len(messages)
+        
+        results = []
+        
+        # Hold the pooled connection for the whole batch so it is authenticated once
+        with self._smtp_lock:
+            for subject, body, html_body in messages:
+                try:
+                    msg = self._build_message(subject, body, html_body)
+                    
+                    try:
+                        self._get_smtp().send_message(msg)
+                    except smtplib.SMTPServerDisconnected:
+                        # Server dropped the session between NOOP and send; retry once
+                        self._close_smtp()
+                        self._get_smtp().send_message(msg)
+                    self._smtp_sent += 1
+                    
+                    logger.info("Email sent successfully to %s", self.email_to)
+                    results.append(True)
+                    
+                except (smtplib.SMTPAuthenticationError, smtplib.SMTPConnectError,
+                        smtplib.SMTPServerDisconnected) as e:
+                    self._abort_email_batch(e, results, len(messages))
+                    break
+                except smtplib.SMTPException as e:
+                    # Rejected message (recipients, size, ...); the session is still usable
+                    logger.error("Failed to send email: %s", e)
+                    results.append(False)
+                except OSError as e:
+                    # Socket-level failure (refused, timed out, unresolvable host)
+                    self._abort_email_batch(e, results, len(messages))
+                    break
+                except Exception as e:
+                    logger.error("Failed to send email: %s", e)
+                    results.append(False)
+        
+        return results
+    
+    def _abort_email_batch(self, error: Exception, results: List[bool], total: int):
+        """
+        Fail the rest of a batch after a login or connection error, which
+        would only repeat for every remaining message.
+        Callers must hold self._smtp_lock.
+        """
+        remaining = total - len(results)
+        logger.error("Failed to send email, skipping %d remaining: %s", remaining - 1, error)
+        self._close_smtp()
+        results.extend([False] * remaining)
     
     def send_webhook(self, data: Dict[str, Any]) -> bool:
         """
@@ -76,7 +474,7 @@ class AlertNotifier:
         """
         try:
             if not self.webhook_url:
-                logging.warning("Webhook URL not configured")
+                logger.warning("Webhook URL not configured")
                 return False
             
             # Add timestamp if not present
@@ -84,22 +482,22 @@ class AlertNotifier:
                 data['timestamp'] = datetime.now().isoformat()
             
             # Send POST request
-            response = requests.post(
+            response = self._session.post(
                 self.webhook_url,
-                json=data,
-                headers={'Content-Type': 'application/json'},
+                data=_dumps(data),
+                headers=self._JSON_HEADERS,
                 timeout=30
             )
             
             response.raise_for_status()
-            logging.info(f"Webhook sent successfully to {self.webhook_url}")
+            logger.info("Webhook sent successfully to %s", self.webhook_url)
             return True
             
         except requests.RequestException as e:
-            logging.error(f"Failed to send webhook: {str(e)}")
+            logger.error("Failed to send webhook: %s", e)
             return False
         except Exception as e:
-            logging.error(f"Unexpected error sending webhook: {str(e)}")
+            logger.error("Unexpected error sending webhook: %s", e)
             return False
     
     def send_discord_webhook(self, webhook_url: str, content: str, embeds: List[Dict] = None) -> bool:
@@ -115,39 +513,38 @@ class AlertNotifier:
             True if successful, False otherwise
         """
         try:
-            payload = {
-                'content': content,
-                'username': 'Social Media RAG Alerts'
-            }
-            
+            payload = {**self._DISCORD_BASE, 'content': content}
             if embeds:
                 payload['embeds'] = embeds
             
-            response = requests.post(
+            response = self._session.post(
                 webhook_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
+                data=_dumps(payload),
+                headers=self._JSON_HEADERS,
                 timeout=30
             )
             
             response.raise_for_status()
-            logging.info("Discord webhook sent successfully")
+            logger.info("Discord webhook sent successfully")
             return True
             
         except requests.RequestException as e:
-            logging.error(f"Failed to send Discord webhook: {str(e)}")
+            logger.error("Failed to send Discord webhook: %s", e)
             return False
     
-    def send_trend_alert(self, trend_data: Dict[str, Any], alert_type: str = "high_trend") -> bool:
+    def _build_trend_alert(self, trend_data: Dict[str, Any], alert_type: str,
+                           email: bool = True, webhook: bool = True) -> Tuple[str, str, str, Dict[str, Any]]:
         """
-        Send alert for trending topic
+        Build the email subject, text body, HTML body and webhook payload for a trend alert
         
         Args:
             trend_data: Dictionary containing trend information
             alert_type: Type of alert being sent
+            email: Whether to build the email parts
+            webhook: Whether to build the webhook payload
             
         Returns:
-            True if any notification method succeeded
+            Tuple of (subject, body, html_body, webhook_data), with None for parts not built
         """
         entity = trend_data.get('entity', 'Unknown')
         trend_score = trend_data.get('trend_score', 0)
@@ -155,94 +552,135 @@ class AlertNotifier:
         current_count = trend_data.get('current_count', 0)
         growth_rate = trend_data.get('growth_rate', 0)
         
-        # Create alert content
-        subject = f"🚨 Trending Alert: {entity}"
+        # Create alert content; one timestamp is shared by every rendering
+        subject = body = html_body = webhook_data = None
+        now = datetime.now()
+        
+        if email:
+            subject = f"🚨 Trending Alert: {entity}"
+            context = {
+                'entity': entity,
+                'platform_title': platform.title(),
+                'trend_score': trend_score,
+                'current_count': current_count,
+                'growth_rate': growth_rate,
+                'alert_type_title': alert_type.replace('_', ' ').title(),
+                'time': now.strftime('%Y-%m-%d %H:%M:%S')
+            }
+            body = TREND_ALERT_TEXT.format_map(context)
+            # Names come from scraped posts, so escape them before going into the HTML
+            html_body = TREND_ALERT_HTML.format_map({
+                **context,
+                'entity': html.escape(str(entity)),
+                'platform_title': html.escape(context['platform_title']),
+                'alert_type_title': html.escape(context['alert_type_title'])
+            })
         
-        body = f"""
-Social Media RAG Alert
-
-Entity: {entity}
-Platform: {platform.title()}
-Trend Score: {trend_score:.2f}σ
-Current Mentions: {current_count:,}
-Growth Rate: {growth_rate:.1%}
-Alert Type: {alert_type.replace('_', ' ').title()}
-
-Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-This topic is trending significantly above normal levels. 
-Check the dashboard for more details: http://localhost:5000
-
----
-Social Media RAG System
-"""
+        # Webhook notification
+        if webhook:
+            webhook_data = {
+                'alert_type': alert_type,
+                'entity': entity,
+                'platform': platform,
+                'trend_score': trend_score,
+                'current_count': current_count,
+                'growth_rate': growth_rate,
+                'timestamp': now.isoformat(),
+                'message': f"Trending alert for {entity} with score {trend_score:.2f}σ"
+            }
         
-        html_body = f"""
-<html>
-<body>
-    <h2>🚨 Social Media RAG Alert</h2>
-    
-    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0;">
-        <h3>{entity}</h3>
-        <table style="width: 100%; border-collapse: collapse;">
-            <tr>
-                <td style="padding: 8px; font-weight: bold;">Platform:</td>
-                <td style="padding: 8px;">{platform.title()}</td>
-            </tr>
-            <tr>
-                <td style="padding: 8px; font-weight: bold;">Trend Score:</td>
-                <td style="padding: 8px; color: #dc3545;"><strong>{trend_score:.2f}σ</strong></td>
-            </tr>
-            <tr>
-                <td style="padding: 8px; font-weight: bold;">Current Mentions:</td>
-                <td style="padding: 8px;">{current_count:,}</td>
-            </tr>
-            <tr>
-                <td style="padding: 8px; font-weight: bold;">Growth Rate:</td>
-                <td style="padding: 8px;">{growth_rate:.1%}</td>
-            </tr>
-            <tr>
-                <td style="padding: 8px; font-weight: bold;">Alert Type:</td>
-                <td style="padding: 8px;">{alert_type.replace('_', ' ').title()}</td>
-            </tr>
-        </table>
-    </div>
-    
-    <p><strong>Time:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        return subject, body, html_body, webhook_data
     
-    <p>This topic is trending significantly above normal levels.</p>
-    
-    <p><a href="http://localhost:5000" style="background-color: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 4px;">View Dashboard</a></p>
+    def send_trend_alert(self, trend_data: Dict[str, Any], alert_type: str = "high_trend") -> bool:
+        """
+        Send alert for trending topic
+        
+        Args:
+            trend_data: Dictionary containing trend information
+            alert_type: Type of alert being sent
+            
+        Returns:
+            True if any notification method succeeded
+        """
+        if not (self._email_ok or self._webhook_ok):
+            return False
+        
+        subject, body, html_body, webhook_data = self._build_trend_alert(
+            trend_data, alert_type, email=self._email_ok, webhook=self._webhook_ok
+        )
+        
+        # Send through every configured notification method in parallel
+        senders = []
+        if self._email_ok:
+            senders.append(lambda: self.send_email(subject, body, html_body))
+        if self._webhook_ok:
+            senders.append(lambda: self.send_webhook(webhook_data))
+        
+        return self._dispatch(*senders)
     
-    <hr style="margin-top: 30px;">
-    <p style="color: #666; font-size: 12px;">Social Media RAG System</p>
-</body>
-</html>
-"""
+    def queue_trend_alert(self, trend_data: Dict[str, Any], alert_type: str = "high_trend"):
+        """
+        Queue a trend alert for background delivery and return immediately
         
-        # Try multiple notification methods
-        success = False
+        Alerts queued within ALERT_BATCH_WINDOW of each other are sent as one
+        batch, keeping only the highest-scoring alert per entity and platform.
         
-        # Email notification
-        if self.send_email(subject, body, html_body):
-            success = True
+        Args:
+            trend_data: Dictionary containing trend information
+            alert_type: Type of alert being sent
+        """
+        self._ensure_worker()
+        self._queue.put((dict(trend_data), alert_type))
+    
+    def send_trend_alerts(self, alerts: List[Tuple[Dict[str, Any], str]], concurrent: bool = True) -> List[bool]:
+        """
+        Send a batch of trend alerts, sharing one SMTP session for all emails
         
-        # Webhook notification
-        webhook_data = {
-            'alert_type': alert_type,
-            'entity': entity,
-            'platform': platform,
-            'trend_score': trend_score,
-            'current_count': current_count,
-            'growth_rate': growth_rate,
-            'timestamp': datetime.now().isoformat(),
-            'message': f"Trending alert for {entity} with score {trend_score:.2f}σ"
-        }
+        Args:
+            alerts: List of (trend_data, alert_type) tuples
+            concurrent: Send webhooks alongside the emails on the worker pool;
+                when False everything is sent from the calling thread
+            
+        Returns:
+            List with a flag per alert, True if any notification method succeeded
+        """
+        if not (self._email_ok or self._webhook_ok):
+            return [False] * len(alerts)
+        
+        built = [
+            self._build_trend_alert(trend_data, alert_type, email=self._email_ok, webhook=self._webhook_ok)
+            for trend_data, alert_type in alerts
+        ]
+        
+        if not concurrent:
+            email_results = (
+                self.send_emails([(subject, body, html_body) for subject, body, html_body, _ in built])
+                if self._email_ok else [False] * len(built)
+            )
+            webhook_results = (
+                [self.send_webhook(webhook_data) for _, _, _, webhook_data in built]
+                if self._webhook_ok else [False] * len(built)
+            )
+            return [email_ok or webhook_ok for email_ok, webhook_ok in zip(email_results, webhook_results)]
+        
+        # Emails go out sequentially on one connection while webhooks run alongside
+        email_future = None
+        if self._email_ok:
+            email_future = self._executor.submit(
+                self.send_emails,
+                [(subject, body, html_body) for subject, body, html_body, _ in built]
+            )
+        webhook_futures = []
+        if self._webhook_ok:
+            webhook_futures = [
+                self._executor.submit(self.send_webhook, webhook_data)
+                for _, _, _, webhook_data in built
+            ]
         
-        if self.send_webhook(webhook_data):
-            success = True
+        email_results = email_future.result() if email_future else [False] * len(built)
+        webhook_results = [future.result() for future in webhook_futures] or [False] * len(built)
         
-        return success
+        return [email_ok or webhook_ok for email_ok, webhook_ok in zip(email_results, webhook_results)]
     
     def send_system_alert(self, message: str, severity: str = "info") -> bool:
         """
@@ -255,44 +693,32 @@ Social Media RAG System
         Returns:
             True if any notification method succeeded
         """
-        severity_emojis = {
-            'info': 'ℹ️',
-            'warning': '⚠️',
-            'error': '❌',
-            'critical': '🚨'
-        }
-        
-        emoji = severity_emojis.get(severity, 'ℹ️')
-        subject = f"{emoji} Social Media RAG System Alert"
-        
-        body = f"""
-System Alert
-
-Severity: {severity.upper()}
-Message: {message}
-Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
----
-Social Media RAG System
-"""
-        
-        # Try email first
-        success = False
-        if self.send_email(subject, body):
-            success = True
-        
-        # Try webhook
-        webhook_data = {
-            'alert_type': 'system',
-            'severity': severity,
-            'message': message,
-            'timestamp': datetime.now().isoformat()
-        }
+        if not (self._email_ok or self._webhook_ok):
+            return False
         
-        if self.send_webhook(webhook_data):
-            success = True
+        now = datetime.now()
+        senders = []
+        
+        if self._email_ok:
+            emoji = self._SEVERITY_EMOJIS.get(severity, 'ℹ️')
+            subject = f"{emoji} Social Media RAG System Alert"
+            body = SYSTEM_ALERT_TEXT.format_map({
+                'severity': severity.upper(),
+                'message': message,
+                'time': now.strftime('%Y-%m-%d %H:%M:%S')
+            })
+            senders.append(lambda: self.send_email(subject, body))
+        
+        if self._webhook_ok:
+            webhook_data = {
+                'alert_type': 'system',
+                'severity': severity,
+                'message': message,
+                'timestamp': now.isoformat()
+            }
+            senders.append(lambda: self.send_webhook(webhook_data))
         
-        return success
+        return self._dispatch(*senders)
     
     def send_digest_alert(self, trends: List[Dict[str, Any]], period: str = "daily") -> bool:
         """
@@ -310,63 +736,35 @@ Social Media RAG System
         
         subject = f"📊 {period.title()} Trending Topics Digest"
         
-        # Create text version
-        body = f"""
-{period.title()} Trending Topics Digest
-
-Top {len(trends)} trending topics:
-
-"""
-        
-        for i, trend in enumerate(trends, 1):
-            body += f"{i}. {trend.get('entity', 'Unknown')} ({trend.get('platform', 'Unknown')})\n"
-            body += f"   Score: {trend.get('trend_score', 0):.2f}σ | Mentions: {trend.get('current_count', 0):,}\n\n"
-        
-        body += f"""
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-View full dashboard: http://localhost:5000
-
----
-Social Media RAG System
-"""
-        
-        # Create HTML version
-        html_body = f"""
-<html>
-<body>
-    <h2>📊 {period.title()} Trending Topics Digest</h2>
-    
-    <p>Top {len(trends)} trending topics:</p>
-    
-    <ol>
-"""
+        # Format every column once over the whole digest instead of per item
+        df = pd.DataFrame(trends, columns=['entity', 'platform', 'trend_score', 'current_count'])
+        df['entity'] = df['entity'].fillna('Unknown').astype(str)
+        df['platform'] = df['platform'].fillna('Unknown').astype(str)
+        df['rank'] = range(1, len(df) + 1)
+        df['score_str'] = df['trend_score'].fillna(0).map("{:.2f}σ".format)
+        df['mentions_str'] = df['current_count'].fillna(0).astype(int).map("{:,}".format)
+        
+        context = {
+            'period_title': period.title(),
+            'count': len(trends),
+            'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
         
-        for trend in trends:
-            html_body += f"""
-        <li>
-            <strong>{trend.get('entity', 'Unknown')}</strong> 
-            <span style="color: #666;">({trend.get('platform', 'Unknown')})</span>
-            <br>
-            <small>
-                Score: <strong>{trend.get('trend_score', 0):.2f}σ</strong> | 
-                Mentions: <strong>{trend.get('current_count', 0):,}</strong>
-            </small>
-        </li>
-"""
+        # Create text and HTML versions; names are escaped before going into the HTML
+        text_items = df[['rank', 'entity', 'platform', 'score_str', 'mentions_str']].to_dict('records')
+        html_items = df.assign(
+            entity=df['entity'].map(html.escape),
+            platform=df['platform'].map(html.escape)
+        )[['entity', 'platform', 'score_str', 'mentions_str']].to_dict('records')
         
-        html_body += f"""
-    </ol>
-    
-    <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-    
-    <p><a href="http://localhost:5000" style="background-color: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 4px;">View Full Dashboard</a></p>
-    
-    <hr>
-    <p style="color: #666; font-size: 12px;">Social Media RAG System</p>
-</body>
-</html>
-"""
+        body = DIGEST_TEXT.format_map({
+            **context,
+            'items': "".join(DIGEST_TEXT_ITEM.format_map(item) for item in text_items)
+        })
+        html_body = DIGEST_HTML.format_map({
+            **context,
+            'items': "".join(DIGEST_HTML_ITEM.format_map(item) for item in html_items)
+        })
         
         return self.send_email(subject, body, html_body)
     
@@ -404,6 +802,7 @@ def get_notifier() -> AlertNotifier:
     global _notifier
     if _notifier is None:
         _notifier = AlertNotifier()
+        atexit.register(_notifier.close)
     return _notifier
 
 def send_trend_alert(trend_data: Dict[str, Any], alert_type: str = "high_trend") -> bool:
@@ -415,3 +814,8 @@ def send_system_alert(message: str, severity: str = "info") -> bool:
     """Convenience function to send system alert"""
     notifier = get_notifier()
     return notifier.send_system_alert(message, severity)
+
+def queue_trend_alert(trend_data: Dict[str, Any], alert_type: str = "high_trend"):
+    """Convenience function to queue a trend alert for background delivery"""
+    notifier = get_notifier()
+    notifier.queue_trend_alert(trend_data, alert_type)
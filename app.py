@@ -1,8 +1,12 @@
 import streamlit as st
 import os
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from sqlalchemy import text
 from utils.config import load_config
-from database.schema import init_database
+from database.schema import init_database, get_engine, get_post_count, iso_cutoff
+from utils.db_utils import bump_trends_generation
 import warnings
 
 warnings.filterwarnings('ignore')
@@ -30,6 +34,115 @@ def setup_directories():
     for directory in directories:
         Path(directory).mkdir(parents=True, exist_ok=True)
 
+@st.cache_data(ttl=30, show_spinner=False)
+def get_stats():
+    """Load post totals and top platforms in one connection, cached across reruns"""
+    engine = get_engine()
+    with engine.connect() as conn:
+        total_posts = get_post_count(conn)
+        
+        # Recent posts (last 24h); compare the stored ISO strings directly so
+        # idx_posts_created_at can serve a range scan
+        recent_posts = conn.execute(text("""
+            SELECT COUNT(*) FROM posts 
+            WHERE created_at > :cutoff
+        """), {"cutoff": iso_cutoff(days=1)}).scalar() or 0
+        
+        # Trigger-maintained per-platform totals, one row per platform
+        top_platforms = pd.read_sql(text("""
+            SELECT platform, cnt as count 
+            FROM platform_counts 
+            WHERE cnt > 0 
+            ORDER BY cnt DESC 
+            LIMIT 5
+        """), conn)
+    
+    return total_posts, recent_posts, top_platforms
+
+@st.cache_resource(show_spinner=False)
+def get_chroma_client():
+    """Open the persistent ChromaDB client once per server process"""
+    import chromadb
+    return chromadb.PersistentClient(path=config.get('CHROMA_PATH', './data/chroma'))
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_collection_count():
+    """Count ChromaDB collections, cached across reruns"""
+    return len(get_chroma_client().list_collections())
+
+@st.cache_resource(show_spinner=False)
+def get_executor():
+    """Shared worker pool so long-running actions don't block the UI"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix='app-action')
+
+def run_ingestion():
+    """Run Reddit and RSS ingestion"""
+    # Heavy pipeline modules are imported on first use; sys.modules keeps them afterwards
+    from pipeline.ingest_reddit import run as run_reddit
+    from pipeline.ingest_rss import run as run_rss
+    run_reddit(limit_per_sub=50)
+    run_rss()
+
+def run_refresh_trends():
+    """Recompute trends"""
+    from scripts.refresh_trends import main as refresh_trends
+    refresh_trends()
+
+def run_index_context():
+    """Index contextual knowledge into the vector store"""
+    from scripts.index_context import main as index_context
+    index_context()
+
+# Background actions: key -> (runner, running, success, failure, cache invalidators to call when done)
+ACTIONS = {
+    'ingest': (run_ingestion, "Ingesting data...", "✅ Data ingestion completed!", "❌ Ingestion failed", (get_stats.clear,)),
+    # Trend loaders live in the pages and are keyed by the trends generation
+    'trends': (run_refresh_trends, "Computing trends...", "✅ Trends refreshed!", "❌ Trend refresh failed", (bump_trends_generation,)),
+    'context': (run_index_context, "Indexing context...", "✅ Context indexed!", "❌ Context indexing failed", (get_collection_count.clear,)),
+}
+
+def start_action(key):
+    """Submit an action to the background pool unless it is already running"""
+    tasks = st.session_state.setdefault('tasks', {})
+    future = tasks.get(key)
+    if future is None or future.done():
+        tasks[key] = get_executor().submit(ACTIONS[key][0])
+        st.session_state.setdefault('handled_tasks', set()).discard(key)
+
+def render_action_status():
+    """Show progress for background actions, polling only while one is running"""
+    tasks = st.session_state.get('tasks', {})
+    running = any(not future.done() for future in tasks.values())
+    
+    @st.fragment(run_every=2 if running else None)
+    def action_status():
+        handled = st.session_state.setdefault('handled_tasks', set())
+        finished = False
+        
+        for key, future in tasks.items():
+            _, running_msg, success_msg, failure_msg, invalidators = ACTIONS[key]
+            if not future.done():
+                st.info(f"⏳ {running_msg}")
+                continue
+            
+            error = future.exception()
+            if error is None:
+                st.success(success_msg)
+            else:
+                st.error(f"{failure_msg}: {str(error)}")
+            
+            if key not in handled:
+                handled.add(key)
+                for invalidate in invalidators:
+                    invalidate()
+                finished = True
+        
+        # Rerun the whole page so stats and button states pick up the result
+        if finished:
+            st.rerun()
+    
+    action_status()
+
 def main():
     setup_directories()
     init_database()
@@ -71,21 +184,15 @@ def main():
         
         # Check database connection
         try:
-            from database.schema import get_engine
-            engine = get_engine()
-            with engine.connect() as conn:
-                result = conn.execute("SELECT COUNT(*) as count FROM posts").fetchone()
-                post_count = result[0] if result else 0
+            post_count, _, _ = get_stats()
             st.success(f"✅ Database Connected ({post_count} posts)")
         except Exception as e:
             st.error(f"❌ Database Error: {str(e)}")
         
         # Check ChromaDB
         try:
-            import chromadb
-            client = chromadb.PersistentClient(path=config.get('CHROMA_PATH', './data/chroma'))
-            collections = client.list_collections()
-            st.success(f"✅ ChromaDB Connected ({len(collections)} collections)")
+            collection_count = get_collection_count()
+            st.success(f"✅ ChromaDB Connected ({collection_count} collections)")
         except Exception as e:
             st.error(f"❌ ChromaDB Error: {str(e)}")
     
@@ -95,38 +202,17 @@ def main():
     with col1:
         st.subheader("📊 Quick Stats")
         try:
-            from database.schema import get_engine
-            engine = get_engine()
-            with engine.connect() as conn:
-                # Total posts
-                result = conn.execute("SELECT COUNT(*) as count FROM posts").fetchone()
-                total_posts = result[0] if result else 0
-                st.metric("Total Posts", f"{total_posts:,}")
-                
-                # Recent posts (last 24h)
-                result = conn.execute("""
-                    SELECT COUNT(*) as count FROM posts 
-                    WHERE datetime(created_at) > datetime('now', '-1 day')
-                """).fetchone()
-                recent_posts = result[0] if result else 0
-                st.metric("Recent Posts (24h)", f"{recent_posts:,}")
-                
+            total_posts, recent_posts, _ = get_stats()
+            st.metric("Total Posts", f"{total_posts:,}")
+            st.metric("Recent Posts (24h)", f"{recent_posts:,}")
+            
         except Exception as e:
             st.error(f"Error loading stats: {str(e)}")
     
     with col2:
         st.subheader("🔥 Top Platforms")
         try:
-            from database.schema import get_engine
-            import pandas as pd
-            engine = get_engine()
-            df = pd.read_sql("""
-                SELECT platform, COUNT(*) as count 
-                FROM posts 
-                GROUP BY platform 
-                ORDER BY count DESC 
-                LIMIT 5
-            """, engine)
+            _, _, df = get_stats()
             if not df.empty:
                 st.dataframe(df, hide_index=True)
             else:
@@ -137,38 +223,21 @@ def main():
     with col3:
         st.subheader("⚡ Actions")
         
-        if st.button("🔄 Run Data Ingestion", type="primary"):
-            with st.spinner("Ingesting data..."):
-                try:
-                    # Run Reddit ingestion
-                    from pipeline.ingest_reddit import run as run_reddit
-                    from pipeline.ingest_rss import run as run_rss
-                    
-                    run_reddit(limit_per_sub=50)
-                    run_rss()
-                    
-                    st.success("✅ Data ingestion completed!")
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"❌ Ingestion failed: {str(e)}")
-        
-        if st.button("📈 Refresh Trends"):
-            with st.spinner("Computing trends..."):
-                try:
-                    from scripts.refresh_trends import main as refresh_trends
-                    refresh_trends()
-                    st.success("✅ Trends refreshed!")
-                except Exception as e:
-                    st.error(f"❌ Trend refresh failed: {str(e)}")
-        
-        if st.button("📚 Index Context"):
-            with st.spinner("Indexing context..."):
-                try:
-                    from scripts.index_context import main as index_context
-                    index_context()
-                    st.success("✅ Context indexed!")
-                except Exception as e:
-                    st.error(f"❌ Context indexing failed: {str(e)}")
+        tasks = st.session_state.get('tasks', {})
+        
+        def is_running(key):
+            return key in tasks and not tasks[key].done()
+        
+        if st.button("🔄 Run Data Ingestion", type="primary", disabled=is_running('ingest')):
+            start_action('ingest')
+        
+        if st.button("📈 Refresh Trends", disabled=is_running('trends')):
+            start_action('trends')
+        
+        if st.button("📚 Index Context", disabled=is_running('context')):
+            start_action('context')
+        
+        render_action_status()
     
     # Footer
     st.markdown("---")
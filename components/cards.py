@@ -1,32 +1,18 @@
 import streamlit as st
+from bisect import bisect_right
 from datetime import datetime
 import pandas as pd
 
-def trend_card(trend_data):
-    """Create a trend card component"""
-    entity = trend_data.get('entity', 'Unknown')
-    trend_score = trend_data.get('trend_score', 0)
-    current_count = trend_data.get('current_count', 0)
-    growth_rate = trend_data.get('growth_rate', 0)
-    platform = trend_data.get('platform', 'Unknown')
-    
-    # Determine trend status
-    if trend_score >= 3.0:
-        status = "🔥 VIRAL"
-        status_color = "red"
-    elif trend_score >= 2.0:
-        status = "📈 TRENDING"
-        status_color = "orange"
-    elif trend_score >= 1.0:
-        status = "📊 RISING"
-        status_color = "blue"
-    else:
-        status = "📉 STABLE"
-        status_color = "green"
-    
-    # Create card
-    with st.container():
-        st.markdown(f"""
+# Trend status bands: scores below 1.0, 2.0 and 3.0, then everything above
+_STATUS_THRESHOLDS = (1.0, 2.0, 3.0)
+_STATUS = (
+    ("📉 STABLE", "green"),
+    ("📊 RISING", "blue"),
+    ("📈 TRENDING", "orange"),
+    ("🔥 VIRAL", "red"),
+)
+
+_TREND_TMPL = """
         <div style="
             border: 1px solid #e0e0e0;
             border-radius: 10px;
@@ -40,9 +26,51 @@ def trend_card(trend_data):
             <p style="margin: 5px 0; font-size: 12px;">Score: {trend_score:.2f}σ</p>
             <p style="margin: 5px 0; font-size: 12px;">Mentions: {current_count:,}</p>
             <p style="margin: 5px 0; font-size: 12px;">Growth: {growth_rate:.1%}</p>
-            <p style="margin: 5px 0; font-size: 12px; color: #666;">Platform: {platform.title()}</p>
+            <p style="margin: 5px 0; font-size: 12px; color: #666;">Platform: {platform}</p>
         </div>
-        """, unsafe_allow_html=True)
+        """
+
+def trend_card_html(trend_data):
+    """Build the HTML for a trend card"""
+    trend_score = trend_data.get('trend_score', 0)
+    status, status_color = _STATUS[bisect_right(_STATUS_THRESHOLDS, trend_score)]
+    
+    return _TREND_TMPL.format_map({
+        'entity': trend_data.get('entity', 'Unknown'),
+        'status': status,
+        'status_color': status_color,
+        'trend_score': trend_score,
+        'current_count': trend_data.get('current_count', 0),
+        'growth_rate': trend_data.get('growth_rate', 0),
+        'platform': trend_data.get('platform', 'Unknown').title(),
+    })
+
+def trend_card(trend_data):
+    """Create a trend card component"""
+    with st.container():
+        st.markdown(trend_card_html(trend_data), unsafe_allow_html=True)
+
+def render_cards(items, card_html, columns=1):
+    """
+    Render a batch of cards with a single markdown call
+    
+    Args:
+        items: Iterable of card data dicts
+        card_html: Function building one card's HTML from its data
+        columns: Number of grid columns to lay the cards out in
+    """
+    # Cards are joined without blank lines so they stay one HTML block
+    html = "".join(card_html(item).strip() for item in items)
+    if not html:
+        return
+    
+    if columns > 1:
+        html = (
+            f'<div style="display: grid; grid-template-columns: repeat({columns}, 1fr); gap: 0 1rem;">'
+            f'{html}</div>'
+        )
+    
+    st.markdown(html, unsafe_allow_html=True)
 
 def post_card(post_data):
     """Create a social media post card"""
@@ -88,8 +116,8 @@ def metric_card(title, value, delta=None, delta_color="normal"):
         delta_color=delta_color
     )
 
-def alert_card(alert_data):
-    """Create an alert card"""
+def alert_card_html(alert_data):
+    """Build the HTML for an alert card"""
     entity = alert_data.get('entity', 'Unknown')
     alert_type = alert_data.get('alert_type', 'Unknown')
     actual_value = alert_data.get('actual_value', 0)
@@ -119,7 +147,7 @@ def alert_card(alert_data):
     
     status_emoji = "🟢" if status == "resolved" else "🔴"
     
-    st.markdown(f"""
+    return f"""
     <div style="
         border-left: 4px solid {color};
         padding: 15px;
@@ -134,7 +162,11 @@ def alert_card(alert_data):
         <p style="margin: 5px 0;"><strong>Time:</strong> {created_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
         <p style="margin: 5px 0;"><strong>Status:</strong> {status_emoji} {status.title()}</p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def alert_card(alert_data):
+    """Create an alert card"""
+    st.markdown(alert_card_html(alert_data), unsafe_allow_html=True)
 
 def context_card(context_data):
     """Create a context information card"""
@@ -165,8 +197,8 @@ def summary_card(title, data_dict):
             else:
                 st.metric(key, value)
 
-def platform_stats_card(platform_data):
-    """Create platform statistics card"""
+def platform_stats_card_html(platform_data):
+    """Build the HTML for a platform statistics card"""
     platform = platform_data.get('platform', 'Unknown')
     total_posts = platform_data.get('total_posts', 0)
     trending_topics = platform_data.get('trending_topics', 0)
@@ -183,7 +215,7 @@ def platform_stats_card(platform_data):
     
     color = platform_colors.get(platform.lower(), '#6c757d')
     
-    st.markdown(f"""
+    return f"""
     <div style="
         border: 2px solid {color};
         border-radius: 12px;
@@ -206,10 +238,14 @@ def platform_stats_card(platform_data):
             Last updated: {last_updated.strftime('%Y-%m-%d %H:%M')}
         </p>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
-def trending_hashtag_card(hashtag_data):
-    """Create trending hashtag card"""
+def platform_stats_card(platform_data):
+    """Create platform statistics card"""
+    st.markdown(platform_stats_card_html(platform_data), unsafe_allow_html=True)
+
+def trending_hashtag_card_html(hashtag_data):
+    """Build the HTML for a trending hashtag card"""
     hashtag = hashtag_data.get('hashtag', '#unknown')
     count = hashtag_data.get('count', 0)
     growth = hashtag_data.get('growth', 0)
@@ -224,8 +260,7 @@ def trending_hashtag_card(hashtag_data):
     
     color = sentiment_colors.get(sentiment, '#6c757d')
     
-    with st.container():
-        st.markdown(f"""
+    return f"""
         <div style="
             border: 1px solid {color};
             border-radius: 8px;
@@ -238,4 +273,9 @@ def trending_hashtag_card(hashtag_data):
             <p style="margin: 3px 0; font-size: 14px;">Growth: <strong>{growth:+.1%}</strong></p>
             <p style="margin: 3px 0; font-size: 14px;">Sentiment: <strong style="color: {color};">{sentiment.title()}</strong></p>
         </div>
-        """, unsafe_allow_html=True)
+        """
+
+def trending_hashtag_card(hashtag_data):
+    """Create trending hashtag card"""
+    with st.container():
+        st.markdown(trending_hashtag_card_html(hashtag_data), unsafe_allow_html=True)
@@ -1,11 +1,85 @@
+import re
+import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+# bottleneck provides a fast moving-window mean; fall back to numpy without it
+try:
+    import bottleneck as bn
+    HAS_BOTTLENECK = True
+except ImportError:
+    HAS_BOTTLENECK = False
+
+# Word tokens for frequency charts, matched against lowercased text
+WORD_PATTERN = re.compile(r'\b[a-z]{3,}\b')
+
+# Common words excluded from word frequency charts
+STOP_WORDS = frozenset({'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'this', 'that'})
+
+# Growth rate bins: inner edges between the six categories below
+GROWTH_BIN_EDGES = np.array([-0.5, -0.1, 0.1, 0.5, 1.0])
+GROWTH_BIN_LABELS = ['Large Decline', 'Decline', 'Stable', 'Growth', 'High Growth', 'Viral']
+
+SENTIMENT_CATEGORIES = ['positive', 'negative', 'neutral']
+
+# Engagement scatters larger than this are drawn as a density heatmap
+SCATTER_DENSITY_THRESHOLD = 50_000
+SCATTER_DENSITY_BINS = 256
+
+# Narrower dtypes for plotted metrics; plenty of precision on screen and half the
+# bytes through pandas and Plotly's serialization. Stored SQL types are unchanged.
+PLOT_DTYPES = {'current_count': 'int32', 'trend_score': 'float32', 'growth_rate': 'float32'}
+
+def _downcast(data):
+    """Downcast the plotted metric columns that are present, leaving the rest as-is"""
+    dtypes = {}
+    for col, dtype in PLOT_DTYPES.items():
+        if col not in data.columns:
+            continue
+        kind = data[col].dtype.kind
+        if kind in 'iu':
+            dtypes[col] = dtype
+        elif kind == 'f':
+            # Floats may hold NaN, which integer dtypes can't represent
+            dtypes[col] = 'float32'
+    
+    return data.astype(dtypes, copy=False) if dtypes else data
+
+def _frame_fingerprint(df):
+    """Cheap cache key for a DataFrame: its shape, columns and a hash of its rows"""
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        # Unhashable cells such as lists; hash their string form instead
+        row_hashes = pd.util.hash_pandas_object(df.astype(str), index=False)
+    return (df.shape, tuple(df.columns), row_hashes.values.tobytes())
+
+# Figures are rebuilt only when their input data changes, not on every rerun
+cache_figure = st.cache_data(ttl=300, show_spinner=False, hash_funcs={pd.DataFrame: _frame_fingerprint})
+
+def _moving_average(values, window):
+    """Trailing mean over up to `window` points, skipping NaNs like rolling(min_periods=1)"""
+    # bottleneck rejects windows longer than the series; the result is the same
+    if HAS_BOTTLENECK and len(values):
+        return bn.move_mean(values, window=min(window, len(values)), min_count=1)
+    
+    # Running sums: each step adds the newest value and drops the one leaving the window
+    valid = ~np.isnan(values)
+    sums = np.cumsum(np.where(valid, values, 0.0))
+    counts = np.cumsum(valid)
+    sums[window:] = sums[window:] - sums[:-window]
+    counts[window:] = counts[window:] - counts[:-window]
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+@cache_figure
 def create_trend_chart(data, title="Trend Analysis"):
     """Create a trend line chart"""
+    data = _downcast(data)
     fig = px.line(
         data,
         x='date',
@@ -31,6 +105,7 @@ def create_trend_chart(data, title="Trend Analysis"):
     
     return fig
 
+@cache_figure
 def create_heatmap(data, x_col, y_col, value_col, title="Heatmap"):
     """Create a heatmap visualization"""
     fig = px.density_heatmap(
@@ -49,16 +124,20 @@ def create_heatmap(data, x_col, y_col, value_col, title="Heatmap"):
     
     return fig
 
+@cache_figure
 def create_sentiment_chart(data, title="Sentiment Distribution"):
     """Create sentiment analysis chart"""
     if 'sentiment' not in data.columns:
         return None
     
-    sentiment_counts = data['sentiment'].value_counts()
+    # Count the known categories directly; anything else is left out
+    codes = pd.Categorical(data['sentiment'], categories=SENTIMENT_CATEGORIES).codes
+    sentiment_counts = np.bincount(codes[codes >= 0], minlength=len(SENTIMENT_CATEGORIES))
     
     fig = px.pie(
-        values=sentiment_counts.values,
-        names=sentiment_counts.index,
+        values=sentiment_counts,
+        names=SENTIMENT_CATEGORIES,
+        color=SENTIMENT_CATEGORIES,
         title=title,
         color_discrete_map={
             'positive': '#28a745',
@@ -69,41 +148,67 @@ def create_sentiment_chart(data, title="Sentiment Distribution"):
     
     return fig
 
+@cache_figure
 def create_platform_comparison(data, title="Platform Comparison"):
     """Create platform comparison chart"""
-    platform_stats = data.groupby('platform').agg({
-        'trend_score': 'mean',
-        'current_count': 'sum',
-        'entity': 'count'
-    }).reset_index()
-    
-    platform_stats.columns = ['Platform', 'Avg Trend Score', 'Total Mentions', 'Unique Topics']
-    
-    fig = px.bar(
-        platform_stats,
-        x='Platform',
-        y='Total Mentions',
+    # Factorize platforms once and reduce each column with bincount
+    codes, platforms = pd.factorize(data['platform'], sort=True)
+    valid = codes >= 0
+    codes = codes[valid]
+    n = len(platforms)
+    
+    scores = data['trend_score'].to_numpy(dtype=np.float64)[valid]
+    mentions = data['current_count'].to_numpy(dtype=np.float64)[valid]
+    has_score = ~np.isnan(scores)
+    
+    score_sum = np.bincount(codes, weights=np.where(has_score, scores, 0.0), minlength=n)
+    score_cnt = np.bincount(codes, weights=has_score, minlength=n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_score = score_sum / score_cnt
+    
+    total_mentions = np.bincount(codes, weights=np.nan_to_num(mentions), minlength=n)
+    if data['current_count'].dtype.kind in 'iu':
+        total_mentions = total_mentions.astype(np.int64)
+    
+    # The per-platform arrays feed the trace directly; no intermediate frame is built
+    fig = go.Figure(go.Bar(
+        x=platforms,
+        y=total_mentions,
+        hovertemplate='Platform=%{x}<br>Total Mentions=%{y}<br>Avg Trend Score=%{marker.color:.2f}<extra></extra>',
+        marker=dict(
+            color=avg_score,
+            colorscale='Viridis',
+            colorbar=dict(title='Avg Trend Score')
+        )
+    ))
+    
+    fig.update_layout(
         title=title,
-        color='Avg Trend Score',
-        color_continuous_scale='Viridis'
+        xaxis_title='Platform',
+        yaxis_title='Total Mentions'
     )
     
     return fig
 
+@cache_figure
 def create_time_series_chart(data, date_col, value_col, title="Time Series"):
     """Create time series chart with moving average"""
-    # Sort by date
-    data_sorted = data.sort_values(date_col)
+    # Sort just the two plotted columns by date instead of copying the whole frame
+    dates = data[date_col].to_numpy()
+    values = data[value_col].to_numpy(dtype=np.float64)
+    order = np.argsort(dates, kind='stable')
+    dates = dates[order]
+    values = values[order]
     
     # Calculate 7-day moving average
-    data_sorted['moving_avg'] = data_sorted[value_col].rolling(window=7, min_periods=1).mean()
+    moving_avg = _moving_average(values, 7)
     
     fig = go.Figure()
     
-    # Add actual values
-    fig.add_trace(go.Scatter(
-        x=data_sorted[date_col],
-        y=data_sorted[value_col],
+    # Add actual values; WebGL keeps the point layer fast for long series
+    fig.add_trace(go.Scattergl(
+        x=dates,
+        y=values,
         mode='lines+markers',
         name='Actual',
         line=dict(color='lightblue', width=1),
@@ -112,8 +217,8 @@ def create_time_series_chart(data, date_col, value_col, title="Time Series"):
     
     # Add moving average
     fig.add_trace(go.Scatter(
-        x=data_sorted[date_col],
-        y=data_sorted['moving_avg'],
+        x=dates,
+        y=moving_avg,
         mode='lines',
         name='7-day Moving Average',
         line=dict(color='red', width=2)
@@ -128,69 +233,79 @@ def create_time_series_chart(data, date_col, value_col, title="Time Series"):
     
     return fig
 
+@cache_figure
 def create_growth_rate_chart(data, title="Growth Rate Analysis"):
     """Create growth rate visualization"""
     if 'growth_rate' not in data.columns:
         return None
     
-    # Create bins for growth rates
-    data['growth_bin'] = pd.cut(
-        data['growth_rate'],
-        bins=[-np.inf, -0.5, -0.1, 0.1, 0.5, 1.0, np.inf],
-        labels=['Large Decline', 'Decline', 'Stable', 'Growth', 'High Growth', 'Viral']
-    )
+    # Bucket growth rates; a value on an edge falls in the lower bin, as with pd.cut
+    growth = data['growth_rate'].to_numpy(dtype=np.float64)
+    growth = growth[~np.isnan(growth)]
+    bin_idx = np.searchsorted(GROWTH_BIN_EDGES, growth, side='left')
+    growth_counts = np.bincount(bin_idx, minlength=len(GROWTH_BIN_LABELS))
     
-    growth_counts = data['growth_bin'].value_counts()
+    fig = go.Figure(go.Bar(
+        x=GROWTH_BIN_LABELS,
+        y=growth_counts,
+        marker=dict(color=growth_counts, colorscale='RdYlGn', showscale=True)
+    ))
     
-    fig = px.bar(
-        x=growth_counts.index,
-        y=growth_counts.values,
+    fig.update_layout(
         title=title,
-        labels={'x': 'Growth Category', 'y': 'Number of Topics'},
-        color=growth_counts.values,
-        color_continuous_scale='RdYlGn'
+        xaxis_title='Growth Category',
+        yaxis_title='Number of Topics'
     )
     
     return fig
 
+@cache_figure
 def create_word_cloud_chart(text_data, title="Word Cloud"):
     """Create word frequency chart (alternative to word cloud)"""
-    from collections import Counter
-    import re
-    
-    # Simple word extraction
-    words = []
-    for text in text_data:
-        words.extend(re.findall(r'\b[a-zA-Z]{3,}\b', text.lower()))
+    # Simple word extraction, vectorized over the whole corpus
+    words = (
+        pd.Series(text_data, dtype='string')
+        .str.lower()
+        .str.findall(WORD_PATTERN)
+        .explode()
+        .dropna()
+    )
     
     # Remove common stop words
-    stop_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'this', 'that'}
-    words = [word for word in words if word not in stop_words]
+    words = words[~words.isin(STOP_WORDS)]
     
-    word_counts = Counter(words).most_common(20)
+    word_counts = words.value_counts().head(20)
     
-    if not word_counts:
+    if word_counts.empty:
         return None
     
-    words, counts = zip(*word_counts)
+    fig = go.Figure(go.Bar(
+        x=word_counts.to_numpy(),
+        y=word_counts.index.to_numpy(),
+        orientation='h'
+    ))
     
-    fig = px.bar(
-        x=list(counts),
-        y=list(words),
-        orientation='h',
+    fig.update_layout(
         title=title,
-        labels={'x': 'Frequency', 'y': 'Words'}
+        xaxis_title='Frequency',
+        yaxis_title='Words',
+        yaxis={'categoryorder': 'total ascending'}
     )
     
-    fig.update_layout(yaxis={'categoryorder': 'total ascending'})
-    
     return fig
 
+@cache_figure
 def create_engagement_scatter(data, title="Engagement vs Trend Score"):
     """Create scatter plot of engagement metrics vs trend scores"""
     if 'current_count' not in data.columns or 'trend_score' not in data.columns:
         return None
     
+    # Past this many points, plot a 2D density instead of one marker per point
+    if len(data) > SCATTER_DENSITY_THRESHOLD:
+        return _create_engagement_density(data, title)
+    
+    data = _downcast(data)
+    
     fig = px.scatter(
         data,
         x='current_count',
@@ -199,6 +314,7 @@ def create_engagement_scatter(data, title="Engagement vs Trend Score"):
         color='platform' if 'platform' in data.columns else None,
         hover_data=['entity'] if 'entity' in data.columns else None,
         title=title,
+        render_mode='webgl',
         labels={
             'current_count': 'Mention Count',
             'trend_score': 'Trend Score (σ)'
@@ -207,15 +323,43 @@ def create_engagement_scatter(data, title="Engagement vs Trend Score"):
     
     # Add trend line
     if len(data) > 1:
-        z = np.polyfit(data['current_count'], data['trend_score'], 1)
+        # Contiguous float64 arrays so polyfit doesn't copy or convert internally
+        x = np.ascontiguousarray(data['current_count'].to_numpy(dtype=np.float64))
+        y = np.ascontiguousarray(data['trend_score'].to_numpy(dtype=np.float64))
+        z = np.polyfit(x, y, 1)
         p = np.poly1d(z)
+        xs = np.sort(x)
         
         fig.add_trace(go.Scatter(
-            x=data['current_count'].sort_values(),
-            y=p(data['current_count'].sort_values()),
+            x=xs,
+            y=p(xs),
             mode='lines',
             name='Trend Line',
             line=dict(dash='dash', color='red')
         ))
     
     return fig
+
+def _create_engagement_density(data, title):
+    """Aggregate engagement points into a 2D histogram heatmap for large datasets"""
+    x = data['current_count'].to_numpy(dtype=np.float64)
+    y = data['trend_score'].to_numpy(dtype=np.float64)
+    finite = np.isfinite(x) & np.isfinite(y)
+    
+    counts, x_edges, y_edges = np.histogram2d(x[finite], y[finite], bins=SCATTER_DENSITY_BINS)
+    
+    fig = go.Figure(go.Heatmap(
+        z=counts.T,
+        x=x_edges,
+        y=y_edges,
+        colorscale='Viridis',
+        colorbar=dict(title='Topics')
+    ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title='Mention Count',
+        yaxis_title='Trend Score (σ)'
+    )
+    
+    return fig
@@ -2,34 +2,44 @@ import streamlit as st
 import pandas as pd
 from sqlalchemy import text
 from datetime import datetime
+from database.schema import get_post_count, iso_cutoff
+from utils.db_utils import trends_generation
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_quick_stats(_engine, generation=0):
+    """Load post total, platform breakdown and 24h trend stats, cached across reruns (generation keys the cache)"""
+    with _engine.connect() as conn:
+        total_posts = get_post_count(conn)
+        
+        # Trigger-maintained per-platform totals instead of a GROUP BY over posts
+        platform_rows = conn.execute(text("""
+            SELECT platform, cnt as count 
+            FROM platform_counts 
+            WHERE cnt > 0 
+            ORDER BY platform
+        """)).fetchall()
+        
+        # Get trend stats
+        trend_count, avg_score, high_trends = conn.execute(text("""
+            SELECT COUNT(*) as count, 
+                   AVG(trend_score) as avg_score,
+                   COUNT(CASE WHEN trend_score >= 2.0 THEN 1 END) as high_trends
+            FROM trends 
+            WHERE created_at >= :cutoff
+        """), {"cutoff": iso_cutoff(hours=24)}).fetchone()
+    
+    # Arrow-backed columns (pyarrow ships with Streamlit) avoid object-dtype strings
+    platform_df = pd.DataFrame.from_records(
+        platform_rows, columns=['platform', 'count']
+    ).convert_dtypes(dtype_backend='pyarrow')
+    return total_posts, platform_df, trend_count, avg_score, high_trends
 
 def show_quick_stats(engine):
     """Display quick stats about the system"""
     st.header("📊 Quick Stats", anchor=False)
     
     try:
-        # Query total posts
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT COUNT(*) FROM posts"))
-            total_posts = result.scalar()
-            
-            # Get platform stats
-            platform_query = text("""
-                SELECT platform, COUNT(*) as count 
-                FROM posts 
-                GROUP BY platform
-            """)
-            platform_df = pd.read_sql_query(platform_query, conn)
-            
-            # Get trend stats
-            trend_query = text("""
-                SELECT COUNT(*) as count, 
-                       AVG(trend_score) as avg_score,
-                       COUNT(CASE WHEN trend_score >= 2.0 THEN 1 END) as high_trends
-                FROM trends 
-                WHERE created_at >= datetime('now', '-24 hours')
-            """)
-            trend_df = pd.read_sql_query(trend_query, conn)
+        total_posts, platform_df, trend_count, avg_score, high_trends = load_quick_stats(engine, trends_generation())
         
         # Display stats
         col1, col2, col3 = st.columns(3)
@@ -38,20 +48,17 @@ def show_quick_stats(engine):
             st.metric("Total Posts", f"{total_posts:,}")
             
         with col2:
-            if not trend_df.empty:
-                st.metric(
-                    "Active Trends", 
-                    int(trend_df['count'].iloc[0]),
-                    delta=int(trend_df['high_trends'].iloc[0])
-                )
-            else:
-                st.metric("Active Trends", "0")
+            st.metric(
+                "Active Trends", 
+                int(trend_count),
+                delta=int(high_trends)
+            )
                 
         with col3:
-            if not trend_df.empty and trend_df['avg_score'].iloc[0] is not None:
+            if avg_score is not None:
                 st.metric(
                     "Avg Trend Score",
-                    f"{trend_df['avg_score'].iloc[0]:.2f}σ"
+                    f"{avg_score:.2f}σ"
                 )
             else:
                 st.metric("Avg Trend Score", "0.00σ")
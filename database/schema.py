@@ -1,23 +1,20 @@
 import os
+import copy
+import functools
 import logging
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Float, Boolean
+import time
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, DateTime, Float, Boolean
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import text as sql
-from datetime import datetime
+from datetime import datetime, timedelta
 import sqlite3
 
 # Database configuration
 DB_PATH = os.path.abspath(os.getenv('DB_PATH', './data/social.db'))
 
-def get_engine():
-    """Get SQLAlchemy engine instance"""
-    db_dir = os.path.dirname(DB_PATH)
-    if not os.path.exists(db_dir):
-        os.makedirs(db_dir)
-    
-    engine = create_engine(f'sqlite:///{DB_PATH}', echo=False)
-    return engine
+# Stats and health reports are reused for this many seconds while the database file is unchanged
+REPORT_CACHE_TTL = 300
 
 # Create Base class for ORM models
 Base = declarative_base()
@@ -61,13 +58,42 @@ class AlertHistory(Base):
     threshold_value = Column(Float)
     actual_value = Column(Float)
     message = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    status = Column(String, default='active')
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=sql('CURRENT_TIMESTAMP'))
+    status = Column(String, default='active', server_default='active')
 
 # Global engine instance
 _engine = None
 _SessionLocal = None
 
+def iso_cutoff(sep: str = 'T', **delta) -> str:
+    """
+    Get a UTC timestamp in the past, formatted for direct comparison with created_at
+    
+    Comparing the raw column against a bound string keeps its index usable,
+    unlike wrapping it in datetime(). Posts and trends store ISO timestamps
+    with a 'T' separator; alert_history uses SQLite's space-separated form.
+    
+    Args:
+        sep: Date/time separator matching the column's stored format
+        **delta: timedelta arguments, e.g. hours=24
+        
+    Returns:
+        Cutoff timestamp string
+    """
+    return (datetime.utcnow() - timedelta(**delta)).isoformat(sep=sep, timespec='seconds')
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection: WAL journaling, relaxed fsync, larger cache and mmap"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    # Lets the row removed by INSERT OR REPLACE fire the AFTER DELETE triggers
+    cursor.execute("PRAGMA recursive_triggers=ON")
+    cursor.close()
+
 def get_engine():
     """Get or create database engine"""
     global _engine
@@ -84,6 +110,7 @@ def get_engine():
             echo=False,  # Set to True for SQL debugging
             connect_args={"check_same_thread": False}
         )
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
         
         logging.info(f"Database engine created for: {DB_PATH}")
     
@@ -131,8 +158,21 @@ def init_database():
                 CREATE INDEX IF NOT EXISTS idx_trends_created_at ON trends(created_at)
             """))
             
+            # Score-ordered scans check the time window from the index before reading rows;
+            # this supersedes the single-column idx_trends_score
+            conn.execute(sql("DROP INDEX IF EXISTS idx_trends_score"))
+            
+            conn.execute(sql("""
+                CREATE INDEX IF NOT EXISTS idx_trends_score_created ON trends(trend_score DESC, created_at)
+            """))
+            
+            # Range indexes for the alert thresholds on growth and volume
+            conn.execute(sql("""
+                CREATE INDEX IF NOT EXISTS idx_trends_growth_rate ON trends(growth_rate)
+            """))
+            
             conn.execute(sql("""
-                CREATE INDEX IF NOT EXISTS idx_trends_score ON trends(trend_score)
+                CREATE INDEX IF NOT EXISTS idx_trends_current_count ON trends(current_count)
             """))
             
             # Index on alert_history table
@@ -144,14 +184,221 @@ def init_database():
                 CREATE INDEX IF NOT EXISTS idx_alerts_entity ON alert_history(entity)
             """))
             
+            # Composite indexes so time-windowed stats are answered from the index alone
+            conn.execute(sql("""
+                CREATE INDEX IF NOT EXISTS idx_trends_created_score ON trends(created_at, trend_score)
+            """))
+            
+            conn.execute(sql("""
+                CREATE INDEX IF NOT EXISTS idx_posts_platform_created ON posts(platform, created_at)
+            """))
+            
+            conn.execute(sql("""
+                CREATE INDEX IF NOT EXISTS idx_posts_created_platform ON posts(created_at, platform)
+            """))
+            
+            conn.execute(sql("""
+                CREATE INDEX IF NOT EXISTS idx_alerts_status_created ON alert_history(status, created_at)
+            """))
+            
+            # Earlier BEFORE INSERT triggers offset rows about to be replaced, but
+            # they also fired for ignored duplicates; drop them and let the seed
+            # statements below recount the totals they may have skewed
+            legacy_triggers = {
+                'posts_bi': 'posts_stats',
+                'platform_counts_bi': 'platform_counts',
+                'posts_daily_bi': 'posts_daily',
+            }
+            
+            for trigger, table in legacy_triggers.items():
+                exists = conn.execute(sql("""
+                    SELECT 1 FROM sqlite_master WHERE type='trigger' AND name=:name
+                """), {"name": trigger}).fetchone()
+                
+                if exists:
+                    conn.execute(sql(f"DROP TRIGGER {trigger}"))
+                    conn.execute(sql(f"DELETE FROM {table}"))
+            
+            # Running post total so the dashboard never needs COUNT(*) over posts.
+            # Rows removed by INSERT OR REPLACE reach the delete triggers through
+            # recursive_triggers (see _set_sqlite_pragmas)
+            conn.execute(sql("""
+                CREATE TABLE IF NOT EXISTS posts_stats (
+                    total INTEGER NOT NULL,
+                    updated_at TEXT
+                )
+            """))
+            
+            # Earlier seeds added a row on every start; only the first is read
+            conn.execute(sql("""
+                DELETE FROM posts_stats WHERE rowid > (SELECT MIN(rowid) FROM posts_stats)
+            """))
+            
+            conn.execute(sql("""
+                INSERT INTO posts_stats (total, updated_at)
+                SELECT (SELECT COUNT(*) FROM posts), CURRENT_TIMESTAMP
+                WHERE NOT EXISTS (SELECT 1 FROM posts_stats)
+            """))
+            
+            conn.execute(sql("""
+                CREATE TRIGGER IF NOT EXISTS posts_ai AFTER INSERT ON posts
+                BEGIN
+                    UPDATE posts_stats SET total = total + 1, updated_at = CURRENT_TIMESTAMP;
+                END
+            """))
+            
+            conn.execute(sql("""
+                CREATE TRIGGER IF NOT EXISTS posts_ad AFTER DELETE ON posts
+                BEGIN
+                    UPDATE posts_stats SET total = total - 1, updated_at = CURRENT_TIMESTAMP;
+                END
+            """))
+            
+            # Per-platform post totals for the home page's top platforms panel
+            conn.execute(sql("""
+                CREATE TABLE IF NOT EXISTS platform_counts (
+                    platform TEXT PRIMARY KEY,
+                    cnt INTEGER NOT NULL
+                )
+            """))
+            
+            conn.execute(sql("""
+                INSERT INTO platform_counts (platform, cnt)
+                SELECT platform, COUNT(*) FROM posts
+                WHERE NOT EXISTS (SELECT 1 FROM platform_counts)
+                GROUP BY platform
+            """))
+            
+            conn.execute(sql("""
+                CREATE TRIGGER IF NOT EXISTS platform_counts_ai AFTER INSERT ON posts
+                BEGIN
+                    INSERT INTO platform_counts (platform, cnt) VALUES (NEW.platform, 1)
+                    ON CONFLICT(platform) DO UPDATE SET cnt = cnt + 1;
+                END
+            """))
+            
+            conn.execute(sql("""
+                CREATE TRIGGER IF NOT EXISTS platform_counts_ad AFTER DELETE ON posts
+                BEGIN
+                    UPDATE platform_counts SET cnt = cnt - 1 WHERE platform = OLD.platform;
+                END
+            """))
+            
+            conn.execute(sql("""
+                CREATE TRIGGER IF NOT EXISTS platform_counts_au AFTER UPDATE OF platform ON posts
+                WHEN OLD.platform IS NOT NEW.platform
+                BEGIN
+                    UPDATE platform_counts SET cnt = cnt - 1 WHERE platform = OLD.platform;
+                    INSERT INTO platform_counts (platform, cnt) VALUES (NEW.platform, 1)
+                    ON CONFLICT(platform) DO UPDATE SET cnt = cnt + 1;
+                END
+            """))
+            
+            # Daily post totals per platform for the dashboard's 30-day volume chart
+            conn.execute(sql("""
+                CREATE TABLE IF NOT EXISTS posts_daily (
+                    date TEXT NOT NULL,
+                    platform TEXT NOT NULL,
+                    post_count INTEGER NOT NULL,
+                    PRIMARY KEY (date, platform)
+                )
+            """))
+            
+            conn.execute(sql("""
+                INSERT INTO posts_daily (date, platform, post_count)
+                SELECT DATE(created_at), platform, COUNT(*) FROM posts
+                WHERE NOT EXISTS (SELECT 1 FROM posts_daily)
+                GROUP BY DATE(created_at), platform
+            """))
+            
+            conn.execute(sql("""
+                CREATE TRIGGER IF NOT EXISTS posts_daily_ai AFTER INSERT ON posts
+                BEGIN
+                    INSERT INTO posts_daily (date, platform, post_count)
+                    VALUES (DATE(NEW.created_at), NEW.platform, 1)
+                    ON CONFLICT(date, platform) DO UPDATE SET post_count = post_count + 1;
+                END
+            """))
+            
+            conn.execute(sql("""
+                CREATE TRIGGER IF NOT EXISTS posts_daily_ad AFTER DELETE ON posts
+                BEGIN
+                    UPDATE posts_daily SET post_count = post_count - 1
+                    WHERE date = DATE(OLD.created_at) AND platform = OLD.platform;
+                END
+            """))
+            
+            conn.execute(sql("""
+                CREATE TRIGGER IF NOT EXISTS posts_daily_au AFTER UPDATE OF platform, created_at ON posts
+                WHEN OLD.platform IS NOT NEW.platform OR DATE(OLD.created_at) IS NOT DATE(NEW.created_at)
+                BEGIN
+                    UPDATE posts_daily SET post_count = post_count - 1
+                    WHERE date = DATE(OLD.created_at) AND platform = OLD.platform;
+                    INSERT INTO posts_daily (date, platform, post_count)
+                    VALUES (DATE(NEW.created_at), NEW.platform, 1)
+                    ON CONFLICT(date, platform) DO UPDATE SET post_count = post_count + 1;
+                END
+            """))
+            
+            # Full-text index over post text, stored externally against posts.rowid
+            has_fts = conn.execute(sql("""
+                SELECT 1 FROM sqlite_master WHERE type='table' AND name='posts_fts'
+            """)).fetchone()
+            
+            conn.execute(sql("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts
+                USING fts5(text, content='posts', content_rowid='rowid')
+            """))
+            
+            if not has_fts:
+                conn.execute(sql("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"))
+            
+            # Replaced rows are removed through posts_fts_ad (recursive_triggers);
+            # the older posts_fts_bi also fired for ignored inserts, so rebuild
+            # an index it may have left out of step
+            had_fts_bi = conn.execute(sql("""
+                SELECT 1 FROM sqlite_master WHERE type='trigger' AND name='posts_fts_bi'
+            """)).fetchone()
+            
+            if had_fts_bi:
+                conn.execute(sql("DROP TRIGGER posts_fts_bi"))
+                conn.execute(sql("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"))
+            
+            conn.execute(sql("""
+                CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts
+                BEGIN
+                    INSERT INTO posts_fts(rowid, text) VALUES (NEW.rowid, NEW.text);
+                END
+            """))
+            
+            conn.execute(sql("""
+                CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts
+                BEGIN
+                    INSERT INTO posts_fts(posts_fts, rowid, text) VALUES ('delete', OLD.rowid, OLD.text);
+                END
+            """))
+            
+            conn.execute(sql("""
+                CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF text ON posts
+                BEGIN
+                    INSERT INTO posts_fts(posts_fts, rowid, text) VALUES ('delete', OLD.rowid, OLD.text);
+                    INSERT INTO posts_fts(rowid, text) VALUES (NEW.rowid, NEW.text);
+                END
+            """))
+            
+            # Gather planner statistics once, then let SQLite refresh them only when stale
+            has_stats = conn.execute(sql("""
+                SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'
+            """)).fetchone()
+            conn.execute(sql("PRAGMA optimize" if has_stats else "ANALYZE"))
+            
             conn.commit()
         
         logging.info("Database initialized successfully with all tables and indexes")
         
         # Log database info
         with engine.connect() as conn:
-            result = conn.execute(sql("SELECT COUNT(*) as count FROM posts")).fetchone()
-            post_count = result[0] if result else 0
+            post_count = get_post_count(conn)
             
             result = conn.execute(sql("SELECT COUNT(*) as count FROM trends")).fetchone()
             trend_count = result[0] if result else 0
@@ -162,6 +409,71 @@ def init_database():
         logging.error(f"Error initializing database: {str(e)}")
         raise
 
+def get_post_count(conn) -> int:
+    """
+    Get the total number of posts from the trigger-maintained counter
+    
+    Args:
+        conn: Open SQLAlchemy connection
+        
+    Returns:
+        Total post count, falling back to COUNT(*) if the counter is missing
+    """
+    try:
+        total = conn.execute(sql("SELECT total FROM posts_stats")).scalar()
+        if total is not None:
+            return total
+    except Exception:
+        pass
+    
+    return conn.execute(sql("SELECT COUNT(*) FROM posts")).scalar() or 0
+
+# Rows per executemany call when bulk loading posts
+BULK_INSERT_BATCH_SIZE = 5000
+
+def bulk_insert_posts(rows: list) -> int:
+    """
+    Insert many posts in a single transaction using executemany
+    
+    Rows use the same shape and write semantics as the ingesters
+    (NormalizedPost.to_dict() and INSERT OR REPLACE), so timestamps stay in
+    one format and the post counters stay accurate. fsync is relaxed for
+    the duration of the load.
+    
+    Args:
+        rows: List of post dicts with id, platform, author, text, url,
+              created_at, hashtags and entities
+        
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+    
+    insert = sql("""
+        INSERT OR REPLACE INTO posts 
+        (id, platform, author, text, url, created_at, hashtags, entities)
+        VALUES (:id, :platform, :author, :text, :url, :created_at, :hashtags, :entities)
+    """)
+    
+    engine = get_engine()
+    with engine.connect() as conn:
+        # PRAGMA synchronous can't change inside a transaction, so set it first
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        try:
+            for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+                conn.execute(insert, rows[start:start + BULK_INSERT_BATCH_SIZE])
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logging.error(f"Error bulk inserting posts: {str(e)}")
+            raise
+        finally:
+            conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
+    
+    logging.info(f"Bulk inserted {len(rows)} posts")
+    return len(rows)
+
 def reset_database():
     """Reset database by dropping and recreating all tables"""
     try:
@@ -169,6 +481,11 @@ def reset_database():
         
         # Drop all tables
         Base.metadata.drop_all(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(sql("DROP TABLE IF EXISTS posts_stats"))
+            conn.execute(sql("DROP TABLE IF EXISTS platform_counts"))
+            conn.execute(sql("DROP TABLE IF EXISTS posts_fts"))
+            conn.execute(sql("DROP TABLE IF EXISTS posts_daily"))
         logging.info("All tables dropped")
         
         # Recreate tables
@@ -179,8 +496,24 @@ def reset_database():
         logging.error(f"Error resetting database: {str(e)}")
         raise
 
+def _db_cache_key():
+    """Cache key for database reports: file mtimes (WAL included) plus the current TTL window"""
+    mtimes = tuple(
+        os.path.getmtime(path) if os.path.exists(path) else None
+        for path in (DB_PATH, f"{DB_PATH}-wal")
+    )
+    return mtimes, int(time.monotonic() // REPORT_CACHE_TTL)
+
 def get_database_stats():
-    """Get database statistics"""
+    """Get database statistics, cached while the database is unchanged"""
+    stats = _cached_database_stats(_db_cache_key())
+    if 'error' in stats:
+        _cached_database_stats.cache_clear()
+    return copy.deepcopy(stats)
+
+@functools.lru_cache(maxsize=4)
+def _cached_database_stats(_cache_key):
+    """Collect database statistics"""
     try:
         engine = get_engine()
         stats = {}
@@ -207,8 +540,8 @@ def get_database_stats():
             # Recent posts (last 24 hours)
             result = conn.execute(sql("""
                 SELECT COUNT(*) as count FROM posts 
-                WHERE datetime(created_at) > datetime('now', '-24 hours')
-            """)).fetchone()
+                WHERE created_at > :cutoff
+            """), {"cutoff": iso_cutoff(hours=24)}).fetchone()
             
             stats['recent_posts'] = result[0] if result else 0
             
@@ -233,8 +566,8 @@ def get_database_stats():
                     MAX(trend_score) as max_score,
                     COUNT(CASE WHEN trend_score >= 2.0 THEN 1 END) as high_trends
                 FROM trends
-                WHERE datetime(created_at) > datetime('now', '-24 hours')
-            """)).fetchone()
+                WHERE created_at > :cutoff
+            """), {"cutoff": iso_cutoff(hours=24)}).fetchone()
             
             if result:
                 stats['trends'] = {
@@ -250,8 +583,8 @@ def get_database_stats():
                     COUNT(*) as total_alerts,
                     COUNT(CASE WHEN status = 'active' THEN 1 END) as active_alerts
                 FROM alert_history
-                WHERE datetime(created_at) > datetime('now', '-7 days')
-            """)).fetchone()
+                WHERE created_at > :cutoff
+            """), {"cutoff": iso_cutoff(sep=' ', days=7)}).fetchone()
             
             if result:
                 stats['alerts'] = {
@@ -274,10 +607,12 @@ def get_database_stats():
 def vacuum_database():
     """Vacuum the database to reclaim space and optimize performance"""
     try:
-        # Use direct SQLite connection for VACUUM
-        conn = sqlite3.connect(DB_PATH)
-        conn.execute("VACUUM")
-        conn.close()
+        # VACUUM can't run inside a transaction, so use an autocommit connection
+        engine = get_engine()
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(sql("VACUUM"))
+            # VACUUM may renumber posts.rowid, which the full-text index is keyed on
+            conn.execute(sql("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"))
         
         logging.info("Database vacuum completed")
         
@@ -313,8 +648,24 @@ def backup_database(backup_path: str = None):
         logging.error(f"Error backing up database: {str(e)}")
         raise
 
-def check_database_health():
-    """Check database health and integrity"""
+def check_database_health(deep: bool = False):
+    """
+    Check database health, cached while the database is unchanged
+    
+    Args:
+        deep: Also run PRAGMA integrity_check, which reads the whole file
+        
+    Returns:
+        Health report dictionary
+    """
+    report = _cached_database_health(_db_cache_key(), deep)
+    if report['status'] == 'error':
+        _cached_database_health.cache_clear()
+    return copy.deepcopy(report)
+
+@functools.lru_cache(maxsize=4)
+def _cached_database_health(_cache_key, deep):
+    """Run the database health checks"""
     try:
         health_report = {
             'status': 'healthy',
@@ -326,13 +677,14 @@ def check_database_health():
         
         with engine.connect() as conn:
             # Check database integrity
-            try:
-                result = conn.execute(sql("PRAGMA integrity_check")).fetchone()
-                if result[0] != 'ok':
-                    health_report['status'] = 'unhealthy'
-                    health_report['issues'].append(f"Integrity check failed: {result[0]}")
-            except Exception as e:
-                health_report['issues'].append(f"Could not run integrity check: {str(e)}")
+            if deep:
+                try:
+                    result = conn.execute(sql("PRAGMA integrity_check")).fetchone()
+                    if result[0] != 'ok':
+                        health_report['status'] = 'unhealthy'
+                        health_report['issues'].append(f"Integrity check failed: {result[0]}")
+                except Exception as e:
+                    health_report['issues'].append(f"Could not run integrity check: {str(e)}")
             
             # Check for missing indexes
             missing_indexes = []
@@ -340,13 +692,13 @@ def check_database_health():
             # Check if our custom indexes exist
             index_queries = [
                 "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_posts_created_at'",
-                "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_trends_score'"
+                "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_trends_score_created'"
             ]
             
             for query in index_queries:
                 result = conn.execute(sql(query)).fetchone()
                 if not result:
-                    missing_indexes.append(query.split("'")[1])
+                    missing_indexes.append(query.split("'")[-2])
             
             if missing_indexes:
                 health_report['recommendations'].append(f"Missing indexes: {', '.join(missing_indexes)}")
@@ -354,8 +706,8 @@ def check_database_health():
             # Check for old data that could be archived
             old_data = conn.execute(sql("""
                 SELECT COUNT(*) FROM trends 
-                WHERE datetime(created_at) < datetime('now', '-90 days')
-            """)).fetchone()
+                WHERE created_at < :cutoff
+            """), {"cutoff": iso_cutoff(days=90)}).fetchone()
             
             if old_data and old_data[0] > 1000:
                 health_report['recommendations'].append(f"Consider archiving {old_data[0]} old trend records")
@@ -389,19 +741,19 @@ def cleanup_old_data(days_to_keep: int = 30):
         
         with engine.begin() as conn:
             # Clean old trends
-            result = conn.execute(sql(f"""
+            result = conn.execute(sql("""
                 DELETE FROM trends 
-                WHERE datetime(created_at) < datetime('now', '-{days_to_keep} days')
-            """))
+                WHERE created_at < :cutoff
+            """), {"cutoff": iso_cutoff(days=days_to_keep)})
             trends_deleted = result.rowcount
             
             # Clean old alerts (keep more alert history)
             alert_days = days_to_keep * 2
-            result = conn.execute(sql(f"""
+            result = conn.execute(sql("""
                 DELETE FROM alert_history 
-                WHERE datetime(created_at) < datetime('now', '-{alert_days} days')
+                WHERE created_at < :cutoff
                 AND status = 'resolved'
-            """))
+            """), {"cutoff": iso_cutoff(sep=' ', days=alert_days)})
             alerts_deleted = result.rowcount
         
         logging.info(f"Cleanup completed: {trends_deleted} trends, {alerts_deleted} alerts deleted")
@@ -424,6 +776,7 @@ if __name__ == "__main__":
     parser.add_argument('--reset', action='store_true', help='Reset database (DANGER: deletes all data)')
     parser.add_argument('--stats', action='store_true', help='Show database statistics')
     parser.add_argument('--health', action='store_true', help='Check database health')
+    parser.add_argument('--deep', action='store_true', help='Include a full integrity check with --health')
     parser.add_argument('--vacuum', action='store_true', help='Vacuum database')
     parser.add_argument('--backup', type=str, help='Backup database to specified path')
     parser.add_argument('--cleanup', type=int, help='Cleanup old data (specify days to keep)')
@@ -455,7 +808,7 @@ if __name__ == "__main__":
             print(f"Database size: {stats['file_size_mb']:.2f} MB")
     
     elif args.health:
-        health = check_database_health()
+        health = check_database_health(deep=args.deep)
         print(f"Database Status: {health['status']}")
         if health['issues']:
             print("Issues:")
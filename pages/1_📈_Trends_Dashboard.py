@@ -2,14 +2,16 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import time
 from datetime import datetime, timedelta
 import numpy as np
-from sqlalchemy import text
+from sqlalchemy import text, bindparam
 from database.schema import get_engine
 from components.charts import create_trend_chart, create_heatmap
-from components.cards import trend_card
+from components.cards import trend_card_html, render_cards
 from utils.config import load_config
-from utils.db_utils import get_quick_stats
+from utils.db_utils import get_quick_stats, read_frame, trends_generation
 
 st.set_page_config(
     page_title="Trends Dashboard",
@@ -19,46 +21,258 @@ st.set_page_config(
 
 config = load_config()
 
+AUTO_REFRESH_SECONDS = 30
+
+# Above this many trends, the Trending Now tab shows a table instead of cards
+CARD_GRID_MAX = 20
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_trends(generation=0):
+    """Load trends from the last 7 days, highest score first (generation keys the cache)"""
+    engine = get_engine()
+    
+    # Load trend data using SQLAlchemy text
+    query = text("""
+        SELECT entity, current_count, baseline_count, trend_score, 
+               growth_rate, created_at, platform
+        FROM trends 
+        WHERE created_at > datetime('now', '-7 days')
+        ORDER BY trend_score DESC
+        LIMIT 100
+    """)
+    trends_df = read_frame(query, engine)
+    trends_df['created_at'] = pd.to_datetime(trends_df['created_at'])
+    return trends_df
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_top_trends(min_score, platforms, limit, generation=0):
+    """
+    Load the highest scoring trends matching the dashboard filters
+    
+    Args:
+        min_score: Minimum trend score to include
+        platforms: Platforms to include
+        limit: Maximum number of trends to return
+        generation: trends_generation() value, so refreshed trends bypass the cache
+    
+    Returns:
+        DataFrame of matching trends ordered by trend score
+    """
+    if not platforms:
+        return pd.DataFrame()
+    
+    engine = get_engine()
+    
+    query = text("""
+        SELECT entity, current_count, baseline_count, trend_score, 
+               growth_rate, created_at, platform
+        FROM trends 
+        WHERE trend_score >= :min_score
+          AND platform IN :platforms
+          AND created_at > datetime('now', '-7 days')
+        ORDER BY trend_score DESC
+        LIMIT :limit
+    """).bindparams(bindparam('platforms', expanding=True))
+    trends_df = read_frame(
+        query, engine,
+        params={'min_score': min_score, 'platforms': list(platforms), 'limit': limit}
+    )
+    trends_df['created_at'] = pd.to_datetime(trends_df['created_at'])
+    return trends_df
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_timeseries():
+    """Load daily post counts per platform for the last 30 days"""
+    engine = get_engine()
+    
+    # posts_daily is kept current by triggers on posts, so no scan or GROUP BY here
+    query = text("""
+        SELECT date, post_count, platform
+        FROM posts_daily
+        WHERE date > date('now', '-30 days') AND post_count > 0
+        ORDER BY date DESC
+    """)
+    timeseries_df = read_frame(query, engine)
+    timeseries_df['date'] = pd.to_datetime(timeseries_df['date'])
+    return timeseries_df
+
+@st.cache_data(ttl=60, show_spinner=False)
+def platform_breakdown(trends_df):
+    """Aggregate mentions and topic counts per platform"""
+    platform_stats = trends_df.groupby('platform', as_index=False).agg(
+        **{
+            'Total Mentions': ('current_count', 'sum'),
+            'Unique Topics': ('entity', 'count'),
+        }
+    ).rename(columns={'platform': 'Platform'})
+    platform_stats['Avg Mentions per Topic'] = (
+        platform_stats['Total Mentions'] / platform_stats['Unique Topics']
+    ).round(1)
+    return platform_stats
+
 def load_trends_data():
     """Load trending topics from database"""
     try:
-        engine = get_engine()
-        
-        # Load trend data using SQLAlchemy text
-        query = text("""
-            SELECT entity, current_count, baseline_count, trend_score, 
-                   growth_rate, created_at, platform
-            FROM trends 
-            WHERE created_at > datetime('now', '-7 days')
-            ORDER BY trend_score DESC
-            LIMIT 100
-        """)
-        trends_df = pd.read_sql_query(query, engine)
+        trends_df = _load_trends(trends_generation())
         
         if trends_df.empty:
             return pd.DataFrame(), pd.DataFrame()
         
-        trends_df['created_at'] = pd.to_datetime(trends_df['created_at'])
-        
-        # Load time series data
-        query = text("""
-            SELECT DATE(created_at) as date, COUNT(*) as post_count,
-                   platform
-            FROM posts 
-            WHERE created_at > datetime('now', '-30 days')
-            GROUP BY DATE(created_at), platform
-            ORDER BY date DESC
-        """)
-        timeseries_df = pd.read_sql_query(query, engine)
-        
-        timeseries_df['date'] = pd.to_datetime(timeseries_df['date'])
-        
-        return trends_df, timeseries_df
+        return trends_df, _load_timeseries()
         
     except Exception as e:
         st.error(f"Error loading trends data: {str(e)}")
         return pd.DataFrame(), pd.DataFrame()
 
+@st.fragment
+def render_trending(trends_df):
+    """Render the Trending Now tab; its filter widgets rerun only this fragment"""
+    st.subheader("Top Trending Topics")
+    
+    # Filter controls
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        min_score = st.slider("Minimum Trend Score", 0.0, 5.0, 1.0, 0.1)
+    with col2:
+        platforms = trends_df['platform'].unique() if not trends_df.empty else []
+        selected_platforms = st.multiselect("Platforms", platforms, default=platforms)
+    with col3:
+        top_n = st.selectbox("Show Top N", [10, 20, 50, 100], index=1)
+    
+    # Filter data
+    try:
+        filtered_trends = load_top_trends(min_score, tuple(selected_platforms), top_n, trends_generation())
+    except Exception as e:
+        st.error(f"Error loading trends data: {str(e)}")
+        filtered_trends = pd.DataFrame()
+    
+    if not filtered_trends.empty:
+        if len(filtered_trends) <= CARD_GRID_MAX:
+            # Display trend cards
+            render_cards(filtered_trends.to_dict('records'), trend_card_html, columns=3)
+        else:
+            # One table element instead of a card per trend
+            st.dataframe(
+                filtered_trends[['entity', 'trend_score', 'growth_rate', 'current_count', 'platform']],
+                column_config={
+                    'entity': st.column_config.TextColumn("Topic"),
+                    'trend_score': st.column_config.ProgressColumn(
+                        "Trend Score (σ)",
+                        format="%.2f",
+                        min_value=0.0,
+                        max_value=max(5.0, float(filtered_trends['trend_score'].max()))
+                    ),
+                    'growth_rate': st.column_config.NumberColumn("Growth", format="percent"),
+                    'current_count': st.column_config.NumberColumn("Mentions"),
+                    'platform': st.column_config.TextColumn("Platform"),
+                },
+                hide_index=True,
+                use_container_width=True
+            )
+        
+        # Trend score distribution
+        fig = go.Figure(go.Histogram(
+            x=filtered_trends['trend_score'].to_numpy(),
+            nbinsx=20
+        ))
+        fig.update_layout(
+            title="Distribution of Trend Scores",
+            xaxis_title="Trend Score (σ)",
+            yaxis_title="Number of Topics"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    else:
+        st.info("No trends match the selected criteria.")
+
+@st.fragment
+def render_analytics(trends_df, timeseries_df):
+    """Render the Analytics tab"""
+    st.subheader("Trend Analytics")
+    
+    if not timeseries_df.empty:
+        # Time series chart
+        fig = go.Figure()
+        for platform, group in timeseries_df.sort_values('date').groupby('platform', sort=False):
+            fig.add_trace(go.Scattergl(
+                x=group['date'].to_numpy(),
+                y=group['post_count'].to_numpy(),
+                mode='lines',
+                name=platform
+            ))
+        fig.update_layout(
+            title="Post Volume Over Time (30 Days)",
+            xaxis_title="Date",
+            yaxis_title="Posts Count",
+            legend_title_text="platform"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Growth rate vs trend score scatter
+        if not trends_df.empty and 'growth_rate' in trends_df.columns:
+            fig = px.scatter(
+                trends_df.head(50),
+                x='growth_rate',
+                y='trend_score',
+                size='current_count',
+                color='platform',
+                hover_data=['entity'],
+                render_mode='webgl',
+                title="Growth Rate vs Trend Score",
+                labels={
+                    'growth_rate': 'Growth Rate (%)',
+                    'trend_score': 'Trend Score (σ)'
+                }
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+    # Top entities by engagement
+    if not trends_df.empty:
+        st.subheader("Most Discussed Topics")
+        top_engagement = trends_df.nlargest(10, 'current_count')[['entity', 'current_count', 'platform']]
+        top_engagement.columns = ['Topic', 'Mentions', 'Platform']
+        st.dataframe(top_engagement, hide_index=True)
+
+@st.fragment
+def render_platforms(trends_df):
+    """Render the Platform Breakdown tab"""
+    st.subheader("Platform Analysis")
+    
+    if not trends_df.empty:
+        # Platform distribution pie chart
+        platform_stats = platform_breakdown(trends_df)
+        
+        labels = platform_stats['Platform'].to_numpy()
+        fig = make_subplots(
+            rows=1, cols=2,
+            specs=[[{'type': 'domain'}, {'type': 'domain'}]],
+            subplot_titles=("Mentions by Platform", "Unique Topics by Platform")
+        )
+        fig.add_trace(go.Pie(
+            labels=labels,
+            values=platform_stats['Total Mentions'].to_numpy(),
+            name="Mentions"
+        ), 1, 1)
+        fig.add_trace(go.Pie(
+            labels=labels,
+            values=platform_stats['Unique Topics'].to_numpy(),
+            name="Unique Topics"
+        ), 1, 2)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Platform comparison table
+        st.subheader("Platform Comparison")
+        st.dataframe(platform_stats, hide_index=True)
+
+@st.fragment(run_every=AUTO_REFRESH_SECONDS)
+def auto_refresh_timer():
+    """Reload the page's data on a timer without blocking the script thread"""
+    elapsed = time.monotonic() - st.session_state.get('trends_refreshed_at', 0)
+    if elapsed >= AUTO_REFRESH_SECONDS:
+        for loader in (_load_trends, load_top_trends, _load_timeseries):
+            loader.clear()
+        st.rerun()
+
 def main():
     st.title("📈 Trends Dashboard")
     st.markdown("Real-time analysis of trending topics across social media platforms")
@@ -111,123 +325,13 @@ def main():
     tab1, tab2, tab3 = st.tabs(["🔥 Trending Now", "📊 Analytics", "🌍 Platform Breakdown"])
     
     with tab1:
-        st.subheader("Top Trending Topics")
-        
-        # Filter controls
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            min_score = st.slider("Minimum Trend Score", 0.0, 5.0, 1.0, 0.1)
-        with col2:
-            platforms = trends_df['platform'].unique() if not trends_df.empty else []
-            selected_platforms = st.multiselect("Platforms", platforms, default=platforms)
-        with col3:
-            top_n = st.selectbox("Show Top N", [10, 20, 50, 100], index=1)
-        
-        # Filter data
-        filtered_trends = trends_df[
-            (trends_df['trend_score'] >= min_score) & 
-            (trends_df['platform'].isin(selected_platforms))
-        ].head(top_n)
-        
-        if not filtered_trends.empty:
-            # Display trend cards
-            for i in range(0, len(filtered_trends), 3):
-                cols = st.columns(3)
-                for j, col in enumerate(cols):
-                    if i + j < len(filtered_trends):
-                        trend_data = filtered_trends.iloc[i + j]
-                        with col:
-                            trend_card(trend_data)
-            
-            # Trend score distribution
-            fig = px.histogram(
-                filtered_trends, 
-                x='trend_score', 
-                nbins=20,
-                title="Distribution of Trend Scores",
-                labels={'trend_score': 'Trend Score (σ)', 'count': 'Number of Topics'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-        else:
-            st.info("No trends match the selected criteria.")
+        render_trending(trends_df)
     
     with tab2:
-        st.subheader("Trend Analytics")
-        
-        if not timeseries_df.empty:
-            # Time series chart
-            fig = px.line(
-                timeseries_df, 
-                x='date', 
-                y='post_count', 
-                color='platform',
-                title="Post Volume Over Time (30 Days)"
-            )
-            fig.update_layout(xaxis_title="Date", yaxis_title="Posts Count")
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Growth rate vs trend score scatter
-            if not trends_df.empty and 'growth_rate' in trends_df.columns:
-                fig = px.scatter(
-                    trends_df.head(50),
-                    x='growth_rate',
-                    y='trend_score',
-                    size='current_count',
-                    color='platform',
-                    hover_data=['entity'],
-                    title="Growth Rate vs Trend Score",
-                    labels={
-                        'growth_rate': 'Growth Rate (%)',
-                        'trend_score': 'Trend Score (σ)'
-                    }
-                )
-                st.plotly_chart(fig, use_container_width=True)
-        
-        # Top entities by engagement
-        if not trends_df.empty:
-            st.subheader("Most Discussed Topics")
-            top_engagement = trends_df.nlargest(10, 'current_count')[['entity', 'current_count', 'platform']]
-            top_engagement.columns = ['Topic', 'Mentions', 'Platform']
-            st.dataframe(top_engagement, hide_index=True)
+        render_analytics(trends_df, timeseries_df)
     
     with tab3:
-        st.subheader("Platform Analysis")
-        
-        if not trends_df.empty:
-            # Platform distribution pie chart
-            platform_stats = trends_df.groupby('platform').agg({
-                'current_count': 'sum',
-                'entity': 'count'
-            }).reset_index()
-            platform_stats.columns = ['Platform', 'Total Mentions', 'Unique Topics']
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig = px.pie(
-                    platform_stats, 
-                    values='Total Mentions', 
-                    names='Platform',
-                    title="Mentions by Platform"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                fig = px.pie(
-                    platform_stats, 
-                    values='Unique Topics', 
-                    names='Platform',
-                    title="Unique Topics by Platform"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            # Platform comparison table
-            st.subheader("Platform Comparison")
-            platform_stats['Avg Mentions per Topic'] = (
-                platform_stats['Total Mentions'] / platform_stats['Unique Topics']
-            ).round(1)
-            st.dataframe(platform_stats, hide_index=True)
+        render_platforms(trends_df)
     
     # Auto-refresh option
     st.sidebar.markdown("---")
@@ -235,9 +339,8 @@ def main():
     auto_refresh = st.sidebar.checkbox("Auto-refresh (30s)")
     
     if auto_refresh:
-        import time
-        time.sleep(30)
-        st.rerun()
+        st.session_state.trends_refreshed_at = time.monotonic()
+        auto_refresh_timer()
 
 if __name__ == "__main__":
     main()
@@ -1,11 +1,15 @@
+import re
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 from database.schema import get_engine
 from rag.retriever import RAGRetriever
 from rag.generator import RAGGenerator
 from utils.config import load_config
-from utils.content_filter import filter_content
+from utils.content_filter import filter_content, filter_content_batch
+from utils.db_utils import read_frame, split_csv_column, trends_generation
 
 st.set_page_config(
     page_title="Topic Explorer",
@@ -21,11 +25,13 @@ def get_rag_system():
     try:
         retriever = RAGRetriever(
             chroma_path=config.get('CHROMA_PATH', './data/chroma'),
-            embedding_model=config.get('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+            embedding_model=config.get('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2'),
+            quantize=config.get('QUANTIZE_MODELS', False)
         )
         
         generator = RAGGenerator(
-            model_name=config.get('GEN_MODEL', 'google/flan-t5-base')
+            model_name=config.get('GEN_MODEL', 'google/flan-t5-base'),
+            quantize=config.get('QUANTIZE_MODELS', False)
         )
         
         return retriever, generator
@@ -33,28 +39,113 @@ def get_rag_system():
         st.error(f"Error initializing RAG system: {str(e)}")
         return None, None
 
-def search_posts(query, platform=None, limit=20):
-    """Search posts by query"""
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def rag_search(_retriever, query, k):
+    """Search the context index, reusing results for repeated (query, k) pairs"""
+    return _retriever.search(query, k=k)
+
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def explain_topic(_generator, query, context, max_length):
+    """Generate an explanation, reusing it for repeated (query, context, max_length)"""
+    analysis = _generator.generate_explanation(
+        query=query,
+        context=context,
+        max_length=max_length
+    )
+    if analysis.startswith("Error generating response"):
+        # Raise so the failure is reported and not cached
+        raise RuntimeError(analysis)
+    return analysis
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_platforms():
+    """Get the distinct platforms present in the posts table"""
+    engine = get_engine()
+    platforms_df = read_frame(text("SELECT DISTINCT platform FROM posts ORDER BY platform"), engine)
+    return platforms_df['platform'].tolist()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_trending_topics(limit=12, generation=0):
+    """Get the top trending topics by score (generation keys the cache)"""
+    engine = get_engine()
+    return read_frame(text("""
+        SELECT entity, trend_score, current_count
+        FROM trends
+        ORDER BY trend_score DESC
+        LIMIT :limit
+    """), engine, params={'limit': limit})
+
+def _fts_match_query(query):
+    """Turn free-form user input into an FTS5 MATCH expression of quoted terms"""
+    terms = re.findall(r'\w+', query)
+    return ' '.join(f'"{term}"' for term in terms)
+
+TEXT_COLUMNS = ['id', 'platform', 'author', 'text', 'url']
+LIST_COLUMNS = ['hashtags', 'entities']
+
+# Search statements are built once so SQLite can reuse their prepared form.
+# ':platform' is 'All' to search every platform.
+_SEARCH_SELECT = "SELECT p.id, p.platform, p.author, p.text, p.url, p.created_at, p.hashtags, p.entities"
+_PLATFORM_FILTER = "(:platform = 'All' OR p.platform = :platform)"
+_FTS_FROM = f"""
+    FROM posts_fts JOIN posts p ON p.rowid = posts_fts.rowid
+    WHERE posts_fts MATCH :match AND {_PLATFORM_FILTER}
+"""
+_LIKE_FROM = f"""
+    FROM posts p
+    WHERE p.text LIKE :pattern AND {_PLATFORM_FILTER}
+"""
+_PAGE = "LIMIT :limit OFFSET :offset"
+
+_FTS_STATEMENTS = {
+    'count': text(f"SELECT COUNT(*) AS total {_FTS_FROM}"),
+    'Most Recent': text(f"{_SEARCH_SELECT} {_FTS_FROM} ORDER BY datetime(p.created_at) DESC {_PAGE}"),
+    'Most Relevant': text(f"{_SEARCH_SELECT} {_FTS_FROM} ORDER BY bm25(posts_fts) {_PAGE}"),
+}
+
+_LIKE_SEARCH = text(f"{_SEARCH_SELECT} {_LIKE_FROM} ORDER BY datetime(p.created_at) DESC {_PAGE}")
+_LIKE_STATEMENTS = {
+    'count': text(f"SELECT COUNT(*) AS total {_LIKE_FROM}"),
+    # bm25 ranking is only available on the full-text path
+    'Most Recent': _LIKE_SEARCH,
+    'Most Relevant': _LIKE_SEARCH,
+}
+
+def _run_search(query, platform, kind, params):
+    """Run a search statement, falling back to LIKE if the full-text index is unavailable"""
+    engine = get_engine()
+    params = {**params, 'platform': platform or "All"}
+    
+    match_query = _fts_match_query(query)
+    if match_query:
+        try:
+            return read_frame(_FTS_STATEMENTS[kind], engine, params={**params, 'match': match_query})
+        except OperationalError:
+            # Full-text index not created yet; fall back to a substring scan
+            pass
+    
+    return read_frame(_LIKE_STATEMENTS[kind], engine, params={**params, 'pattern': f"%{query}%"})
+
+def count_posts(query, platform=None):
+    """Count posts matching a search query"""
     try:
-        engine = get_engine()
-        
-        where_clause = "WHERE text LIKE ?"
-        params = [f"%{query}%"]
+        df = _run_search(query, platform, 'count', {})
+        return int(df['total'].iloc[0])
         
-        if platform and platform != "All":
-            where_clause += " AND platform = ?"
-            params.append(platform)
-        
-        sql_query = f"""
-            SELECT id, platform, author, text, url, created_at, hashtags, entities
-            FROM posts
-            {where_clause}
-            ORDER BY datetime(created_at) DESC
-            LIMIT {limit}
-        """
-        
-        df = pd.read_sql(sql_query, engine, params=params)
+    except Exception as e:
+        st.error(f"Error counting posts: {str(e)}")
+        return 0
+
+def search_posts(query, platform=None, limit=20, offset=0, sort_by="Most Recent"):
+    """Search posts by query, returning one page of results"""
+    try:
+        df = _run_search(query, platform, sort_by, {'limit': limit, 'offset': offset})
         df['created_at'] = pd.to_datetime(df['created_at'])
+        # Arrow-backed strings; missing optional fields become '' so truthiness checks still work
+        df[TEXT_COLUMNS] = df[TEXT_COLUMNS].fillna('').astype('string[pyarrow]')
+        # Split comma-joined tags once here rather than on every render
+        for column in LIST_COLUMNS:
+            df[column] = split_csv_column(df[column])
         return df
         
     except Exception as e:
@@ -68,13 +159,86 @@ def get_related_topics(query):
         if not retriever:
             return []
         
-        results = retriever.search(query, k=5)
+        results = rag_search(retriever, query, 5)
         return [result.get('entity', 'Unknown') for result in results]
         
     except Exception as e:
         st.error(f"Error getting related topics: {str(e)}")
         return []
 
+@st.fragment
+def render_posts(search_query, selected_platform):
+    """Render the Posts tab; paging and display options rerun only this fragment"""
+    st.subheader(f"Posts containing: '{search_query}'")
+    
+    # Filter and display options
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        show_filtered = st.checkbox("Apply content filtering", value=True)
+    with col2:
+        posts_per_page = st.selectbox("Posts per page", [10, 20, 50], index=1)
+    with col3:
+        sort_by = st.selectbox("Sort by", ["Most Recent", "Most Relevant"])
+    
+    # Count matches so only the visible page is fetched
+    total_posts = count_posts(search_query, selected_platform)
+    
+    if total_posts:
+        # Display results count
+        st.info(f"Found {total_posts} posts")
+        
+        # Paginate results
+        total_pages = max(1, (total_posts - 1) // posts_per_page + 1)
+        
+        if total_pages > 1:
+            page = st.selectbox(f"Page (1-{total_pages})", range(1, total_pages + 1))
+        else:
+            page = 1
+        
+        page_posts = search_posts(
+            search_query, selected_platform,
+            limit=posts_per_page,
+            offset=(page - 1) * posts_per_page,
+            sort_by=sort_by
+        )
+        
+        # Apply filtering if requested
+        if show_filtered and not page_posts.empty:
+            page_posts = page_posts[filter_content_batch(page_posts['text'].tolist())]
+        
+        # Display posts
+        for post in page_posts.itertuples(index=False):
+            with st.expander(
+                f"📱 {post.platform.title()} - {post.created_at.strftime('%Y-%m-%d %H:%M')}",
+                expanded=False
+            ):
+                # Post content
+                st.write(post.text[:500] + "..." if len(post.text) > 500 else post.text)
+                
+                # Metadata
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    if post.author:
+                        st.text(f"👤 {post.author}")
+                with col2:
+                    if post.hashtags:
+                        st.text(f"#️⃣ {', '.join(post.hashtags[:3])}")
+                with col3:
+                    if post.url:
+                        st.link_button("🔗 View Original", post.url)
+                
+                # Entities
+                if post.entities:
+                    st.text(f"🏷️ Tags: {', '.join(post.entities[:5])}")
+                
+                # Content safety check
+                safety_result = filter_content(post.text)
+                if not safety_result['is_safe']:
+                    st.warning(f"⚠️ Content Warning: {', '.join(safety_result['flags'])}")
+    
+    else:
+        st.info(f"No posts found for '{search_query}'. Try different keywords or check if data ingestion has been run.")
+
 def main():
     st.title("🔎 Topic Explorer")
     st.markdown("Search and explore social media topics with AI-powered contextual analysis")
@@ -91,9 +255,7 @@ def main():
     with col2:
         # Platform filter
         try:
-            engine = get_engine()
-            platforms_df = pd.read_sql("SELECT DISTINCT platform FROM posts ORDER BY platform", engine)
-            platforms = ["All"] + platforms_df['platform'].tolist()
+            platforms = ["All"] + load_platforms()
             selected_platform = st.selectbox("Platform", platforms)
         except:
             selected_platform = "All"
@@ -102,75 +264,7 @@ def main():
         tab1, tab2, tab3 = st.tabs(["📱 Posts", "🤖 AI Analysis", "🔗 Related Topics"])
         
         with tab1:
-            st.subheader(f"Posts containing: '{search_query}'")
-            
-            # Search posts
-            posts_df = search_posts(search_query, selected_platform)
-            
-            if not posts_df.empty:
-                # Display results count
-                st.info(f"Found {len(posts_df)} posts")
-                
-                # Filter and display options
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    show_filtered = st.checkbox("Apply content filtering", value=True)
-                with col2:
-                    posts_per_page = st.selectbox("Posts per page", [10, 20, 50], index=1)
-                with col3:
-                    sort_by = st.selectbox("Sort by", ["Most Recent", "Most Relevant"])
-                
-                # Apply filtering if requested
-                if show_filtered:
-                    posts_df = posts_df[posts_df['text'].apply(
-                        lambda x: filter_content(x)['is_safe']
-                    )]
-                
-                # Paginate results
-                total_pages = max(1, (len(posts_df) - 1) // posts_per_page + 1)
-                
-                if total_pages > 1:
-                    page = st.selectbox(f"Page (1-{total_pages})", range(1, total_pages + 1))
-                    start_idx = (page - 1) * posts_per_page
-                    end_idx = start_idx + posts_per_page
-                    page_posts = posts_df.iloc[start_idx:end_idx]
-                else:
-                    page_posts = posts_df.head(posts_per_page)
-                
-                # Display posts
-                for idx, post in page_posts.iterrows():
-                    with st.expander(
-                        f"📱 {post['platform'].title()} - {post['created_at'].strftime('%Y-%m-%d %H:%M')}",
-                        expanded=False
-                    ):
-                        # Post content
-                        st.write(post['text'][:500] + "..." if len(post['text']) > 500 else post['text'])
-                        
-                        # Metadata
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            if post['author']:
-                                st.text(f"👤 {post['author']}")
-                        with col2:
-                            if post['hashtags']:
-                                hashtags = post['hashtags'].split(',')
-                                st.text(f"#️⃣ {', '.join(hashtags[:3])}")
-                        with col3:
-                            if post['url']:
-                                st.link_button("🔗 View Original", post['url'])
-                        
-                        # Entities
-                        if post['entities']:
-                            entities = post['entities'].split(',')[:5]
-                            st.text(f"🏷️ Tags: {', '.join(entities)}")
-                        
-                        # Content safety check
-                        safety_result = filter_content(post['text'])
-                        if not safety_result['is_safe']:
-                            st.warning(f"⚠️ Content Warning: {', '.join(safety_result['flags'])}")
-            
-            else:
-                st.info(f"No posts found for '{search_query}'. Try different keywords or check if data ingestion has been run.")
+            render_posts(search_query, selected_platform)
         
         with tab2:
             st.subheader("🤖 AI-Powered Analysis")
@@ -181,7 +275,7 @@ def main():
                 with st.spinner("Generating analysis..."):
                     try:
                         # Get context from RAG
-                        context_results = retriever.search(search_query, k=3)
+                        context_results = rag_search(retriever, search_query, 3)
                         
                         if context_results:
                             # Generate analysis
@@ -190,11 +284,7 @@ def main():
                                 for result in context_results
                             ])
                             
-                            analysis = generator.generate_explanation(
-                                query=search_query,
-                                context=context_text,
-                                max_length=200
-                            )
+                            analysis = explain_topic(generator, search_query, context_text, 200)
                             
                             # Display analysis
                             st.markdown("### 📝 Contextual Analysis")
@@ -257,24 +347,24 @@ def main():
                 # Trending topics in same category
                 try:
                     engine = get_engine()
-                    similar_trends = pd.read_sql("""
+                    similar_trends = read_frame(text("""
                         SELECT entity, trend_score, current_count
                         FROM trends
-                        WHERE entity LIKE ?
+                        WHERE entity LIKE :pattern
                         ORDER BY trend_score DESC
                         LIMIT 10
-                    """, engine, params=[f"%{search_query.split()[0]}%"])
+                    """), engine, params={'pattern': f"%{search_query.split()[0]}%"})
                     
                     if not similar_trends.empty:
                         st.markdown("### 📈 Trending Similar Topics")
-                        for _, trend in similar_trends.iterrows():
+                        for trend in similar_trends.itertuples(index=False):
                             col1, col2, col3 = st.columns([2, 1, 1])
                             with col1:
-                                st.write(f"**{trend['entity']}**")
+                                st.write(f"**{trend.entity}**")
                             with col2:
-                                st.write(f"Score: {trend['trend_score']:.1f}")
+                                st.write(f"Score: {trend.trend_score:.1f}")
                             with col3:
-                                st.write(f"Mentions: {trend['current_count']}")
+                                st.write(f"Mentions: {trend.current_count}")
                 
                 except Exception as e:
                     st.error(f"Error loading similar trends: {str(e)}")
@@ -285,25 +375,19 @@ def main():
         st.markdown("Click on any trending topic to explore it:")
         
         try:
-            engine = get_engine()
-            trending_df = pd.read_sql("""
-                SELECT entity, trend_score, current_count
-                FROM trends
-                ORDER BY trend_score DESC
-                LIMIT 12
-            """, engine)
+            trending_df = load_trending_topics(generation=trends_generation())
             
             if not trending_df.empty:
                 cols = st.columns(3)
-                for i, (_, trend) in enumerate(trending_df.iterrows()):
+                for i, trend in enumerate(trending_df.itertuples(index=False)):
                     with cols[i % 3]:
                         if st.button(
-                            f"🔥 {trend['entity'][:30]}{'...' if len(trend['entity']) > 30 else ''}\n"
-                            f"Score: {trend['trend_score']:.1f} | Mentions: {trend['current_count']}",
+                            f"🔥 {trend.entity[:30]}{'...' if len(trend.entity) > 30 else ''}\n"
+                            f"Score: {trend.trend_score:.1f} | Mentions: {trend.current_count}",
                             key=f"trending_{i}"
                         ):
                             # Set search query and rerun
-                            st.session_state.search_query = trend['entity']
+                            st.session_state.search_query = trend.entity
                             st.rerun()
             else:
                 st.info("No trending topics available. Run data ingestion and trend computation first.")
@@ -1,11 +1,22 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
-from datetime import datetime, timedelta
-from database.schema import get_engine
-from alerts.notifier import AlertNotifier
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from sqlalchemy import text, bindparam
+from database.schema import get_engine, iso_cutoff
+from utils.db_utils import read_frame, trends_generation
+from alerts.notifier import get_notifier
 from utils.config import load_config
 
+# Prefer orjson for the alert config file, fall back to the stdlib parser
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 st.set_page_config(
     page_title="Alerts & Monitoring",
     page_icon="🚨",
@@ -14,56 +25,189 @@ st.set_page_config(
 
 config = load_config()
 
-def load_alert_history():
-    """Load alert history from database"""
+MONITOR_LIMIT = 20
+HISTORY_LIMIT = 100
+HISTORY_CHUNK_SIZE = 500
+
+DATE_RANGE_DAYS = {
+    'All Time': None,
+    'Last 24 Hours': 1,
+    'Last 7 Days': 7,
+    'Last 30 Days': 30
+}
+
+# One branch per threshold so each is an index range scan instead of an OR
+# over the whole table; a branch's top rows by score bound the overall top rows
+_MONITOR_BRANCH = """
+    SELECT * FROM (
+        SELECT id, entity, trend_score, growth_rate, current_count, created_at, platform
+        FROM trends
+        WHERE {column} >= :{param}
+        ORDER BY trend_score DESC
+        LIMIT :limit
+    )
+"""
+
+_MONITOR_STATEMENT = text(" UNION ALL ".join(
+    _MONITOR_BRANCH.format(column=column, param=param)
+    for column, param in (
+        ('trend_score', 'trend_threshold'),
+        ('growth_rate', 'growth_threshold'),
+        ('current_count', 'volume_threshold')
+    )
+))
+
+# Alert history statements, built once and reused on every rerun
+_SUMMARY_STATEMENT = text("""
+    SELECT alert_type,
+           COUNT(*) AS alerts,
+           SUM(created_at >= :day_ago) AS last_24h,
+           SUM(status = 'active') AS active,
+           SUM(actual_value) AS score_total,
+           COUNT(actual_value) AS scored
+    FROM (
+        SELECT alert_type, created_at, status, actual_value
+        FROM alert_history
+        ORDER BY created_at DESC
+        LIMIT :limit
+    )
+    GROUP BY alert_type
+    ORDER BY MAX(created_at) DESC
+""")
+
+_HISTORY_STATEMENT = text("""
+    SELECT * FROM alert_history
+    WHERE (:alert_type = 'All' OR alert_type = :alert_type)
+      AND (:since IS NULL OR created_at >= :since)
+      AND (:status = 'All' OR status = :status)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit
+""")
+
+_INSERT_ALERT_STATEMENT = text("""
+    INSERT INTO alert_history (entity, alert_type, threshold_value, actual_value, message, created_at, status)
+    VALUES (:entity, :alert_type, :threshold_value, :actual_value, :message, CURRENT_TIMESTAMP, 'active')
+""")
+
+_RESOLVE_STATEMENT = text(
+    "UPDATE alert_history SET status = 'resolved' WHERE id IN :ids"
+).bindparams(bindparam('ids', expanding=True))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_alert_summary():
+    """Aggregate the most recent alerts per alert type, newest type first"""
+    engine = get_engine()
+    
+    return read_frame(_SUMMARY_STATEMENT, engine, {'day_ago': iso_cutoff(sep=' ', days=1), 'limit': HISTORY_LIMIT})
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_alert_history(alert_type='All', days=None, status='All'):
+    """Load the most recent alerts matching the given type, age and status"""
+    engine = get_engine()
+    
+    params = {
+        'alert_type': alert_type,
+        'since': iso_cutoff(sep=' ', days=days) if days else None,
+        'status': status,
+        'limit': HISTORY_LIMIT
+    }
+    
+    # Stream the rows in chunks so longer histories never sit in memory twice
+    with engine.connect().execution_options(stream_results=True) as conn:
+        chunks = pd.read_sql(_HISTORY_STATEMENT, conn, params=params, chunksize=HISTORY_CHUNK_SIZE, parse_dates=['created_at'])
+        return pd.concat(chunks, ignore_index=True)
+
+def clear_alert_history_cache():
+    """Drop cached alert history after alerts are created or updated"""
+    _load_alert_summary.clear()
+    _load_alert_history.clear()
+
+def clear_alert_history_selection():
+    """Drop the history table's row selection; its positions refer to the old rows"""
+    st.session_state.pop('alert_history_table', None)
+
+def load_alert_summary():
+    """Load per-type alert counts for the history overview"""
     try:
-        engine = get_engine()
-        
-        # Create alerts table if it doesn't exist
-        with engine.connect() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS alert_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    entity TEXT NOT NULL,
-                    alert_type TEXT NOT NULL,
-                    threshold_value REAL,
-                    actual_value REAL,
-                    message TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    status TEXT DEFAULT 'active'
-                )
-            """)
-            conn.commit()
-        
-        df = pd.read_sql("""
-            SELECT * FROM alert_history
-            ORDER BY created_at DESC
-            LIMIT 100
-        """, engine)
-        
-        if not df.empty:
-            df['created_at'] = pd.to_datetime(df['created_at'])
+        return _load_alert_summary()
+    
+    except Exception as e:
+        st.error(f"Error loading alert summary: {str(e)}")
+        return pd.DataFrame()
+
+def load_alert_history(alert_type='All', days=None, status='All'):
+    """
+    Load alert history from database
+    
+    Args:
+        alert_type: Alert type to keep, or 'All'
+        days: Only keep alerts from the last this many days; None keeps all
+        status: Alert status to keep, or 'All'
         
-        return df
+    Returns:
+        DataFrame of matching alerts, newest first
+    """
+    try:
+        return _load_alert_history(alert_type, days, status)
     
     except Exception as e:
         st.error(f"Error loading alert history: {str(e)}")
         return pd.DataFrame()
 
+@st.cache_data(ttl=60, show_spinner=False)
+def load_monitored_trends(trend_threshold, growth_threshold, volume_threshold, generation=0):
+    """
+    Load the highest scoring trends that exceed any alert threshold
+    
+    Args:
+        trend_threshold: Minimum trend score
+        growth_threshold: Minimum growth rate as a fraction
+        volume_threshold: Minimum current mention count
+        generation: trends_generation() value, so refreshed trends bypass the cache
+        
+    Returns:
+        DataFrame of at most MONITOR_LIMIT trends, highest score first
+    """
+    trending_df = read_frame(_MONITOR_STATEMENT, get_engine(), {
+        'trend_threshold': trend_threshold,
+        'growth_threshold': growth_threshold,
+        'volume_threshold': volume_threshold,
+        'limit': MONITOR_LIMIT
+    })
+    
+    # A trend exceeding several thresholds comes back once per branch
+    if trending_df.empty:
+        return trending_df
+    
+    return (
+        trending_df.drop_duplicates('id')
+        .sort_values('trend_score', ascending=False, kind='stable')
+        .head(MONITOR_LIMIT)
+        .reset_index(drop=True)
+    )
+
 def save_alert_config(config_data):
     """Save alert configuration"""
     try:
-        with open('data/alert_config.json', 'w') as f:
-            json.dump(config_data, f, indent=2)
+        if HAS_ORJSON:
+            with open('data/alert_config.json', 'wb') as f:
+                f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open('data/alert_config.json', 'w') as f:
+                json.dump(config_data, f, indent=2)
+        _load_alert_config.clear()
         return True
     except Exception as e:
         st.error(f"Error saving alert config: {str(e)}")
         return False
 
-def load_alert_config():
-    """Load alert configuration"""
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_alert_config():
+    """Read the alert configuration file, falling back to defaults"""
     try:
-        with open('data/alert_config.json', 'r') as f:
+        with open('data/alert_config.json', 'rb') as f:
+            if HAS_ORJSON:
+                return orjson.loads(f.read())
             return json.load(f)
     except FileNotFoundError:
         # Default configuration
@@ -76,37 +220,155 @@ def load_alert_config():
             'notification_methods': ['email'],
             'check_interval': 300  # 5 minutes
         }
+
+def load_alert_config():
+    """Load alert configuration"""
+    try:
+        return _load_alert_config()
     except Exception as e:
         st.error(f"Error loading alert config: {str(e)}")
         return {}
 
-def create_alert(entity, alert_type, threshold_value, actual_value, message):
-    """Create a new alert"""
+def create_alerts_bulk(rows):
+    """
+    Create several alerts in a single transaction
+    
+    Args:
+        rows: List of dicts with entity, alert_type, threshold_value,
+            actual_value and message keys
+        
+    Returns:
+        True if every alert was stored
+    """
+    if not rows:
+        return True
+    
     try:
         engine = get_engine()
-        with engine.connect() as conn:
-            conn.execute("""
-                INSERT INTO alert_history (entity, alert_type, threshold_value, actual_value, message)
-                VALUES (?, ?, ?, ?, ?)
-            """, (entity, alert_type, threshold_value, actual_value, message))
-            conn.commit()
+        with engine.begin() as conn:
+            conn.execute(_INSERT_ALERT_STATEMENT, rows)
+        clear_alert_history_cache()
         return True
     except Exception as e:
-        st.error(f"Error creating alert: {str(e)}")
+        st.error(f"Error creating alerts: {str(e)}")
         return False
 
+def resolve_alerts(alert_ids):
+    """
+    Mark alerts as resolved in a single statement
+    
+    Args:
+        alert_ids: IDs of the alerts to resolve
+        
+    Returns:
+        True if the update succeeded
+    """
+    try:
+        engine = get_engine()
+        with engine.begin() as conn:
+            conn.execute(
+                _RESOLVE_STATEMENT,
+                {'ids': [int(alert_id) for alert_id in alert_ids]}
+            )
+        clear_alert_history_cache()
+        return True
+    except Exception as e:
+        st.error(f"Error updating alerts: {str(e)}")
+        return False
+
+def create_alert(entity, alert_type, threshold_value, actual_value, message):
+    """Create a new alert"""
+    return create_alerts_bulk([{
+        'entity': entity,
+        'alert_type': alert_type,
+        'threshold_value': threshold_value,
+        'actual_value': actual_value,
+        'message': message
+    }])
+
+@st.cache_resource(show_spinner=False)
+def get_test_executor():
+    """Shared worker pool so notification tests don't block the page"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix='alert-test')
+
+def send_test_email(entity, message):
+    """Send a test email through the shared notifier"""
+    return get_notifier().send_email(
+        subject=f"Test Alert: {entity}",
+        body=message
+    )
+
+def send_test_webhook(entity, message):
+    """Send a test webhook through the shared notifier"""
+    return get_notifier().send_webhook({
+        'entity': entity,
+        'message': message,
+        'timestamp': datetime.now().isoformat(),
+        'type': 'test'
+    })
+
+# Notification tests: key -> (sender, running, success, failure, error prefix)
+NOTIFICATION_TESTS = {
+    'email': (send_test_email, "Sending test email...", "✅ Email sent successfully!",
+              "❌ Email sending failed. Check configuration.", "Email test error"),
+    'webhook': (send_test_webhook, "Sending test webhook...", "✅ Webhook sent successfully!",
+                "❌ Webhook sending failed. Check configuration.", "Webhook test error"),
+}
+
+def start_notification_test(key, entity, message):
+    """Submit a notification test to the background pool unless one is already running"""
+    tests = st.session_state.setdefault('notification_tests', {})
+    future = tests.get(key)
+    if future is None or future.done():
+        tests[key] = get_test_executor().submit(NOTIFICATION_TESTS[key][0], entity, message)
+        st.session_state.setdefault('handled_notification_tests', set()).discard(key)
+
+def render_notification_tests():
+    """Show notification test results, polling only while one is running"""
+    tests = st.session_state.get('notification_tests', {})
+    running = any(not future.done() for future in tests.values())
+    
+    @st.fragment(run_every=1 if running else None)
+    def notification_status():
+        handled = st.session_state.setdefault('handled_notification_tests', set())
+        finished = False
+        
+        for key, future in tests.items():
+            _, running_msg, success_msg, failure_msg, error_prefix = NOTIFICATION_TESTS[key]
+            if not future.done():
+                st.info(f"⏳ {running_msg}")
+                continue
+            
+            error = future.exception()
+            if error is not None:
+                st.error(f"{error_prefix}: {str(error)}")
+            elif future.result():
+                st.success(success_msg)
+            else:
+                st.error(failure_msg)
+            
+            if key not in handled:
+                handled.add(key)
+                finished = True
+        
+        # Rerun the whole page once so polling stops after the last test finishes
+        if finished and running:
+            st.rerun()
+    
+    notification_status()
+
 def main():
     st.title("🚨 Alerts & Monitoring")
     st.markdown("Configure alerts and monitor significant trend changes")
     
+    # Load current configuration once for every tab
+    current_config = load_alert_config()
+    
     tab1, tab2, tab3, tab4 = st.tabs(["⚙️ Configuration", "📋 Active Alerts", "📊 Alert History", "🧪 Test Alerts"])
     
     with tab1:
         st.subheader("Alert Configuration")
         
-        # Load current configuration
-        current_config = load_alert_config()
-        
         col1, col2 = st.columns(2)
         
         with col1:
@@ -211,53 +473,53 @@ def main():
         
         # Current trending topics that might trigger alerts
         try:
-            engine = get_engine()
-            current_config = load_alert_config()
+            trend_threshold = current_config.get('trend_threshold', 2.0)
+            growth_threshold = current_config.get('growth_threshold', 1.0) / 100
+            volume_threshold = current_config.get('volume_threshold', 100)
             
             # Get current trends that exceed thresholds
-            trending_df = pd.read_sql(f"""
-                SELECT entity, trend_score, growth_rate, current_count, created_at, platform
-                FROM trends
-                WHERE trend_score >= {current_config.get('trend_threshold', 2.0)}
-                   OR growth_rate >= {current_config.get('growth_threshold', 1.0) / 100}
-                   OR current_count >= {current_config.get('volume_threshold', 100)}
-                ORDER BY trend_score DESC
-                LIMIT 20
-            """, engine)
+            trending_df = load_monitored_trends(
+                trend_threshold, growth_threshold, volume_threshold, trends_generation()
+            )
             
             if not trending_df.empty:
                 st.success(f"🔍 Monitoring {len(trending_df)} topics exceeding alert thresholds")
                 
-                for idx, trend in trending_df.iterrows():
-                    with st.expander(f"🚨 {trend['entity']} - Score: {trend['trend_score']:.2f}"):
+                # Flag every threshold in one pass instead of comparing per row
+                trending_df['exceeds_trend'] = trending_df['trend_score'] >= trend_threshold
+                trending_df['exceeds_growth'] = trending_df['growth_rate'] >= growth_threshold
+                trending_df['exceeds_volume'] = trending_df['current_count'] >= volume_threshold
+                
+                for idx, trend in enumerate(trending_df.itertuples(index=False)):
+                    with st.expander(f"🚨 {trend.entity} - Score: {trend.trend_score:.2f}"):
                         col1, col2, col3 = st.columns(3)
                         
                         with col1:
-                            st.metric("Trend Score", f"{trend['trend_score']:.2f}σ")
-                            if trend['trend_score'] >= current_config.get('trend_threshold', 2.0):
+                            st.metric("Trend Score", f"{trend.trend_score:.2f}σ")
+                            if trend.exceeds_trend:
                                 st.error("⚠️ Exceeds threshold!")
                         
                         with col2:
-                            st.metric("Growth Rate", f"{trend['growth_rate']:.1%}")
-                            if trend['growth_rate'] >= current_config.get('growth_threshold', 1.0) / 100:
+                            st.metric("Growth Rate", f"{trend.growth_rate:.1%}")
+                            if trend.exceeds_growth:
                                 st.error("⚠️ Exceeds threshold!")
                         
                         with col3:
-                            st.metric("Mentions", trend['current_count'])
-                            if trend['current_count'] >= current_config.get('volume_threshold', 100):
+                            st.metric("Mentions", trend.current_count)
+                            if trend.exceeds_volume:
                                 st.error("⚠️ Exceeds threshold!")
                         
-                        st.write(f"**Platform:** {trend['platform']}")
-                        st.write(f"**Last Updated:** {trend['created_at']}")
+                        st.write(f"**Platform:** {trend.platform}")
+                        st.write(f"**Last Updated:** {trend.created_at}")
                         
                         # Manual alert trigger
-                        if st.button(f"🚨 Send Alert for {trend['entity']}", key=f"alert_{idx}"):
+                        if st.button(f"🚨 Send Alert for {trend.entity}", key=f"alert_{idx}"):
                             success = create_alert(
-                                trend['entity'],
+                                trend.entity,
                                 'manual',
-                                current_config.get('trend_threshold', 2.0),
-                                trend['trend_score'],
-                                f"Manual alert triggered for {trend['entity']} with trend score {trend['trend_score']:.2f}"
+                                trend_threshold,
+                                trend.trend_score,
+                                f"Manual alert triggered for {trend.entity} with trend score {trend.trend_score:.2f}"
                             )
                             if success:
                                 st.success("Alert created!")
@@ -290,95 +552,103 @@ def main():
     with tab3:
         st.subheader("📊 Alert History")
         
-        # Load and display alert history
-        alert_history = load_alert_history()
+        # Summarise recent alerts; the filter options come from the same query
+        alert_summary = load_alert_summary()
         
-        if not alert_history.empty:
+        if not alert_summary.empty:
             # Summary stats
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                total_alerts = len(alert_history)
+                total_alerts = int(alert_summary['alerts'].sum())
                 st.metric("Total Alerts", total_alerts)
             
             with col2:
-                recent_alerts = len(alert_history[
-                    alert_history['created_at'] > datetime.now() - timedelta(days=1)
-                ])
+                recent_alerts = int(alert_summary['last_24h'].sum())
                 st.metric("Last 24h", recent_alerts)
             
             with col3:
-                active_alerts = len(alert_history[alert_history['status'] == 'active'])
+                active_alerts = int(alert_summary['active'].sum())
                 st.metric("Active", active_alerts)
             
             with col4:
-                avg_score = alert_history['actual_value'].mean()
+                scored = alert_summary['scored'].sum()
+                avg_score = alert_summary['score_total'].sum() / scored if scored else float('nan')
                 st.metric("Avg Score", f"{avg_score:.1f}")
             
             # Filters
             col1, col2, col3 = st.columns(3)
             with col1:
-                alert_types = ['All'] + alert_history['alert_type'].unique().tolist()
-                selected_type = st.selectbox("Alert Type", alert_types)
+                alert_types = ['All'] + alert_summary['alert_type'].tolist()
+                selected_type = st.selectbox("Alert Type", alert_types, on_change=clear_alert_history_selection)
             
             with col2:
-                date_range = st.selectbox("Date Range", 
-                    ['All Time', 'Last 24 Hours', 'Last 7 Days', 'Last 30 Days'])
+                date_range = st.selectbox("Date Range", list(DATE_RANGE_DAYS), on_change=clear_alert_history_selection)
             
             with col3:
-                status_filter = st.selectbox("Status", ['All', 'active', 'resolved'])
-            
-            # Apply filters
-            filtered_alerts = alert_history.copy()
-            
-            if selected_type != 'All':
-                filtered_alerts = filtered_alerts[filtered_alerts['alert_type'] == selected_type]
-            
-            if date_range != 'All Time':
-                days_map = {
-                    'Last 24 Hours': 1,
-                    'Last 7 Days': 7,
-                    'Last 30 Days': 30
-                }
-                cutoff_date = datetime.now() - timedelta(days=days_map[date_range])
-                filtered_alerts = filtered_alerts[filtered_alerts['created_at'] >= cutoff_date]
+                status_filter = st.selectbox(
+                    "Status", ['All', 'active', 'resolved'], on_change=clear_alert_history_selection
+                )
             
-            if status_filter != 'All':
-                filtered_alerts = filtered_alerts[filtered_alerts['status'] == status_filter]
+            # Filters are applied in SQL
+            filtered_alerts = load_alert_history(
+                alert_type=selected_type,
+                days=DATE_RANGE_DAYS[date_range],
+                status=status_filter
+            )
             
-            # Display alerts
+            # Display alerts as one table; details and actions follow the selected row
             if not filtered_alerts.empty:
-                for idx, alert in filtered_alerts.iterrows():
-                    with st.expander(
-                        f"{alert['alert_type'].title()} Alert: {alert['entity']} - {alert['created_at'].strftime('%Y-%m-%d %H:%M')}"
-                    ):
-                        col1, col2 = st.columns([2, 1])
-                        
-                        with col1:
-                            st.write(f"**Message:** {alert['message']}")
-                            st.write(f"**Entity:** {alert['entity']}")
-                            st.write(f"**Threshold:** {alert['threshold_value']}")
-                            st.write(f"**Actual Value:** {alert['actual_value']}")
-                        
-                        with col2:
-                            status_color = "🟢" if alert['status'] == 'resolved' else "🔴"
-                            st.write(f"**Status:** {status_color} {alert['status'].title()}")
-                            
-                            if alert['status'] == 'active':
-                                if st.button(f"Mark Resolved", key=f"resolve_{alert['id']}"):
-                                    # Update status
-                                    try:
-                                        engine = get_engine()
-                                        with engine.connect() as conn:
-                                            conn.execute(
-                                                "UPDATE alert_history SET status = 'resolved' WHERE id = ?",
-                                                (alert['id'],)
-                                            )
-                                            conn.commit()
-                                        st.success("Alert marked as resolved!")
-                                        st.rerun()
-                                    except Exception as e:
-                                        st.error(f"Error updating alert: {str(e)}")
+                filtered_alerts['status_label'] = np.where(
+                    filtered_alerts['status'] == 'resolved', '🟢 Resolved', '🔴 Active'
+                )
+                
+                selection = st.dataframe(
+                    filtered_alerts[['created_at', 'alert_type', 'entity', 'status_label', 'threshold_value', 'actual_value']],
+                    column_config={
+                        'created_at': st.column_config.DatetimeColumn("Created", format="YYYY-MM-DD HH:mm"),
+                        'alert_type': st.column_config.TextColumn("Type"),
+                        'entity': st.column_config.TextColumn("Entity"),
+                        'status_label': st.column_config.TextColumn("Status"),
+                        'threshold_value': st.column_config.NumberColumn("Threshold"),
+                        'actual_value': st.column_config.NumberColumn("Actual Value")
+                    },
+                    hide_index=True,
+                    use_container_width=True,
+                    on_select="rerun",
+                    selection_mode="multi-row",
+                    key="alert_history_table"
+                )
+                
+                # The keyed selection survives data changes, so ignore positions past the current rows
+                selected_rows = [row for row in selection.selection.rows if row < len(filtered_alerts)]
+                selected_alerts = filtered_alerts.iloc[selected_rows]
+                if len(selected_alerts) == 1:
+                    alert = selected_alerts.iloc[0]
+                    
+                    col1, col2 = st.columns([2, 1])
+                    
+                    with col1:
+                        st.write(f"**Message:** {alert['message']}")
+                        st.write(f"**Entity:** {alert['entity']}")
+                        st.write(f"**Threshold:** {alert['threshold_value']}")
+                        st.write(f"**Actual Value:** {alert['actual_value']}")
+                    
+                    with col2:
+                        st.write(f"**Status:** {alert['status_label']}")
+                elif len(selected_alerts) > 1:
+                    st.caption(f"{len(selected_alerts)} alerts selected.")
+                else:
+                    st.caption("Select alerts to see details or resolve them together.")
+                
+                # Resolve every selected active alert in one statement
+                active_ids = selected_alerts.loc[selected_alerts['status'] == 'active', 'id'].tolist()
+                if active_ids:
+                    if st.button(f"Mark Resolved ({len(active_ids)})", key="resolve_selected"):
+                        if resolve_alerts(active_ids):
+                            clear_alert_history_selection()
+                            st.success("Alerts marked as resolved!")
+                            st.rerun()
             else:
                 st.info("No alerts match the selected criteria.")
         
@@ -398,35 +668,11 @@ def main():
         
         with col1:
             if st.button("📧 Test Email Alert"):
-                try:
-                    notifier = AlertNotifier()
-                    success = notifier.send_email(
-                        subject=f"Test Alert: {test_entity}",
-                        body=test_message
-                    )
-                    if success:
-                        st.success("✅ Email sent successfully!")
-                    else:
-                        st.error("❌ Email sending failed. Check configuration.")
-                except Exception as e:
-                    st.error(f"Email test error: {str(e)}")
+                start_notification_test('email', test_entity, test_message)
         
         with col2:
             if st.button("🌐 Test Webhook Alert"):
-                try:
-                    notifier = AlertNotifier()
-                    success = notifier.send_webhook({
-                        'entity': test_entity,
-                        'message': test_message,
-                        'timestamp': datetime.now().isoformat(),
-                        'type': 'test'
-                    })
-                    if success:
-                        st.success("✅ Webhook sent successfully!")
-                    else:
-                        st.error("❌ Webhook sending failed. Check configuration.")
-                except Exception as e:
-                    st.error(f"Webhook test error: {str(e)}")
+                start_notification_test('webhook', test_entity, test_message)
         
         with col3:
             if st.button("💾 Test Database Alert"):
@@ -443,6 +689,8 @@ def main():
                 else:
                     st.error("❌ Database alert creation failed.")
         
+        render_notification_tests()
+        
         # Alert simulation
         st.markdown("### 🎭 Simulate Alert Conditions")
         
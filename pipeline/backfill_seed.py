@@ -5,9 +5,12 @@ This script ingests initial data from Reddit and RSS feeds to populate the datab
 """
 
 import argparse
+import atexit
 import logging
-import time
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List
 import sys
 import os
@@ -18,19 +21,37 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from pipeline.ingest_reddit import run as run_reddit_ingestion
 from pipeline.ingest_rss import run as run_rss_ingestion
 from pipeline.trends import compute_trends
-from database.schema import init_database
+from database.schema import init_database, get_engine, get_post_count
 from utils.config import load_config
 
+# Log records held in memory before the backfill log file is written
+LOG_BUFFER_CAPACITY = 1024
+
 def setup_logging(verbose: bool = False):
     """Setup logging configuration"""
     level = logging.DEBUG if verbose else logging.INFO
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    
+    # Buffer file records and write them in batches; errors still reach disk immediately
+    file_handler = logging.FileHandler('logs/backfill.log', mode='a')
+    file_handler.setFormatter(logging.Formatter(log_format))
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    atexit.register(buffered_handler.flush)
+    
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler('logs/backfill.log', mode='a')
-        ]
+            buffered_handler
+        ],
+        # create_directories() logs before this runs, which implicitly installs
+        # a WARNING-level root handler that would otherwise make this a no-op
+        force=True
     )
 
 def run_data_ingestion(hours: int = 24, reddit_limit: int = 200, rss_limit: int = 50) -> dict:
@@ -56,10 +77,14 @@ def run_data_ingestion(hours: int = 24, reddit_limit: int = 200, rss_limit: int
     try:
         logging.info(f"Starting data ingestion for ~{hours} hours of data")
         
-        # Reddit ingestion
-        logging.info("Starting Reddit ingestion...")
+        # Reddit and RSS are independent network-bound sources, so fetch them concurrently
+        logging.info("Starting Reddit and RSS ingestion...")
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix='backfill') as executor:
+            reddit_future = executor.submit(run_reddit_ingestion, limit_per_sub=reddit_limit)
+            rss_future = executor.submit(run_rss_ingestion, max_entries_per_feed=rss_limit)
+        
         try:
-            reddit_count = run_reddit_ingestion(limit_per_sub=reddit_limit)
+            reddit_count = reddit_future.result()
             results['reddit_posts'] = reddit_count
             logging.info(f"✅ Reddit ingestion completed: {reddit_count} posts")
         except Exception as e:
@@ -67,13 +92,8 @@ def run_data_ingestion(hours: int = 24, reddit_limit: int = 200, rss_limit: int
             logging.error(error_msg)
             results['errors'].append(error_msg)
         
-        # Brief pause between ingestions
-        time.sleep(2)
-        
-        # RSS ingestion
-        logging.info("Starting RSS ingestion...")
         try:
-            rss_count = run_rss_ingestion(max_entries_per_feed=rss_limit)
+            rss_count = rss_future.result()
             results['rss_entries'] = rss_count
             logging.info(f"✅ RSS ingestion completed: {rss_count} entries")
         except Exception as e:
@@ -152,15 +172,18 @@ def validate_environment():
 def create_directories():
     """Create necessary directories"""
     directories = [
-        'data',
         'data/chroma',
         'context/wikipedia_cache',
         'logs'
     ]
     
+    # Warm runs find everything in place; skip the mkdir attempts entirely
+    if all(os.path.isdir(directory) for directory in directories):
+        return True
+    
     for directory in directories:
         try:
-            os.makedirs(directory, exist_ok=True)
+            Path(directory).mkdir(parents=True, exist_ok=True)
             logging.debug(f"✅ Directory ensured: {directory}")
         except Exception as e:
             logging.error(f"❌ Failed to create directory {directory}: {str(e)}")
@@ -186,6 +209,11 @@ def main():
     
     args = parser.parse_args()
     
+    # Create directories first; the log file lives in logs/
+    if not create_directories():
+        logging.error("❌ Directory creation failed")
+        sys.exit(1)
+    
     # Setup
     setup_logging(args.verbose)
     logging.info("🚀 Starting Social Media RAG backfill process")
@@ -195,11 +223,6 @@ def main():
         logging.error("❌ Environment validation failed")
         sys.exit(1)
     
-    # Create directories
-    if not create_directories():
-        logging.error("❌ Directory creation failed")
-        sys.exit(1)
-    
     # Load configuration
     try:
         config = load_config()
@@ -216,20 +239,19 @@ def main():
         logging.error(f"❌ Database initialization failed: {str(e)}")
         sys.exit(1)
     
-    # Check if data already exists (unless force flag is used)
-    if not args.force:
+    # Check if data already exists (unless force flag is used); only ask when someone can answer
+    if not args.force and sys.stdin.isatty():
         try:
-            from database.schema import get_engine
             engine = get_engine()
             with engine.connect() as conn:
-                result = conn.execute("SELECT COUNT(*) as count FROM posts").fetchone()
-                existing_posts = result[0] if result else 0
-                
-                if existing_posts > 100:  # Arbitrary threshold
-                    response = input(f"Found {existing_posts} existing posts. Continue anyway? (y/N): ")
-                    if response.lower() != 'y':
-                        logging.info("Backfill cancelled by user")
-                        sys.exit(0)
+                # Read the trigger-maintained counter instead of scanning posts
+                existing_posts = get_post_count(conn)
+            
+            if existing_posts > 100:  # Arbitrary threshold
+                response = input(f"Found {existing_posts} existing posts. Continue anyway? (y/N): ")
+                if response.lower() != 'y':
+                    logging.info("Backfill cancelled by user")
+                    sys.exit(0)
         except Exception as e:
             logging.warning(f"Could not check existing data: {str(e)}")
     
@@ -1,7 +1,9 @@
 import re
 import string
+import copy
 from collections import Counter
-from typing import List, Dict, Set
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Optional
 import logging
 
 # Regex patterns for feature extraction
@@ -11,9 +13,17 @@ URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?
 WORD_PATTERN = re.compile(r'(?i)\b[a-z][a-z0-9_\'-]+[a-z0-9_]\b')  # Modified to require at least 3 chars
 EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
 HTML_PATTERN = re.compile(r'<[^>]+>')  # Pattern to match HTML tags
+ASCII_LETTER_PATTERN = re.compile(r'[a-z]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Token prefixes that indicate leftover URL/HTML fragments
+URL_TOKEN_PREFIXES = ('http', 'www', 'html', 'src', 'href')
+
+# Number of distinct texts whose full feature set is kept in memory
+FEATURE_CACHE_SIZE = 4096
 
 # Common stop words
-STOP_WORDS: Set[str] = {
+STOP_WORDS: FrozenSet[str] = frozenset({
     'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', "you're",
     "you've", "you'll", "you'd", 'your', 'yours', 'yourself', 'yourselves',
     'he', 'him', 'his', 'himself', 'she', "she's", 'her', 'hers', 'herself',
@@ -37,7 +47,7 @@ STOP_WORDS: Set[str] = {
     'http', 'https', 'www', 'com', 'html', 'href', 'span', 'div', 'class', 'src',
     'alt', 'img', 'width', 'height', 'style', 'rel', 'id', 'type', 'content',
     'target', 'title', 'xmlns', 'lang', 'meta', 'name', 'value', 'charset'
-}
+})
 
 # Additional generic tokens that commonly surface as noisy "trends"
 # These reduce false positives like 'new', 'would', 'like', etc.
@@ -47,7 +57,7 @@ EXTRA_GENERIC_STOP_WORDS = {
 }
 
 # Merge into STOP_WORDS
-STOP_WORDS.update(EXTRA_GENERIC_STOP_WORDS)
+STOP_WORDS = STOP_WORDS | EXTRA_GENERIC_STOP_WORDS
 
 # Internet slang and abbreviations
 INTERNET_SLANG = {
@@ -71,6 +81,112 @@ INTERNET_SLANG = {
     'psa': 'public_service_announcement'
 }
 
+# Known entity keywords by category, matched case-insensitively on word boundaries
+ENTITY_KEYWORDS: Dict[str, tuple] = {
+    'covid': ('covid', 'coronavirus', 'pandemic', 'vaccine', 'pfizer', 'moderna', 'omicron', 'delta'),
+    'climate': ('climate', 'global warming', 'greenhouse', 'carbon', 'emission', 'greta'),
+    'crypto': ('bitcoin', 'crypto', 'blockchain', 'ethereum', 'nft', 'dogecoin', 'elon'),
+    'politics': ('trump', 'biden', 'election', 'democrat', 'republican', 'congress', 'senate'),
+    'tech': ('apple', 'google', 'microsoft', 'amazon', 'meta', 'twitter', 'tiktok', 'ai', 'chatgpt'),
+    'sports': ('nfl', 'nba', 'fifa', 'olympics', 'superbowl', 'worldcup', 'playoff'),
+    'entertainment': ('netflix', 'disney', 'marvel', 'starwars', 'game of thrones', 'stranger things')
+}
+
+# Literal meme phrases, checked as plain substrings of the lowercased text
+MEME_INDICATORS = (
+    'stonks', 'hodl', 'diamond hands', 'to the moon',
+    'this is fine', 'change my mind', 'ok boomer',
+    'big chungus', 'among us', 'sus', 'impostor',
+    'chad', 'karen', 'simp', 'based', 'cringe',
+    'poggers', 'kekw', 'monke', 'bonk'
+)
+
+# Simple sentiment word lists
+POSITIVE_WORDS = frozenset({
+    'good', 'great', 'excellent', 'amazing', 'awesome', 'fantastic',
+    'love', 'like', 'enjoy', 'happy', 'pleased', 'satisfied',
+    'wonderful', 'brilliant', 'perfect', 'best', 'favorite',
+    'thank', 'thanks', 'grateful', 'appreciate', 'nice',
+    'cool', 'sweet', 'dope', 'fire', 'lit', 'poggers',
+    'based', 'wholesome', 'blessed'
+})
+
+NEGATIVE_WORDS = frozenset({
+    'bad', 'terrible', 'awful', 'horrible', 'disgusting',
+    'hate', 'dislike', 'angry', 'mad', 'furious', 'annoyed',
+    'sad', 'depressed', 'disappointed', 'frustrated',
+    'worst', 'suck', 'sucks', 'stupid', 'dumb', 'idiotic',
+    'cringe', 'toxic', 'trash', 'garbage', 'pathetic',
+    'fail', 'failure', 'disaster', 'nightmare'
+})
+
+def _keyword_trie_regex(keywords) -> str:
+    """Build a prefix-factored alternation so the regex engine walks a trie instead of trying each keyword"""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+# All entity keywords in one pass over the text
+ENTITY_KEYWORD_PATTERN = re.compile(
+    r'(?i)\b(' + _keyword_trie_regex(kw for group in ENTITY_KEYWORDS.values() for kw in group) + r')\b'
+)
+
+# Trending-content phrase patterns, in reporting order within each category.
+# Word boundaries are added around the whole alternation when compiled.
+BREAKING_NEWS_PATTERNS = (
+    r'breaking\b.*\bnews',
+    r'just\s+in',
+    r'urgent',
+    r'alert',
+    r'update'
+)
+
+VIRAL_PATTERNS = (
+    r'gone\s+viral',
+    r'trending',
+    r'going\s+viral',
+    r'everyone\s+is\s+talking',
+    r'internet\s+is\s+losing'
+)
+
+EVENT_PATTERNS = (
+    r'(?:today|yesterday|now|just|recently|currently)',
+    r'(?:happening|occurred|announced|revealed|confirmed)',
+    r'(?:live|real\s+time|as\s+we\s+speak)'
+)
+
+def _fuse_patterns(patterns) -> re.Pattern:
+    """Compile word-bounded patterns into one alternation with a numbered group per pattern"""
+    # Checking the boundaries once outside the alternation lets the engine
+    # skip non-word-start positions instead of retrying every branch there
+    alternation = '|'.join(f'(?P<g{i}>{pattern})' for i, pattern in enumerate(patterns))
+    return re.compile(rf'\b(?:{alternation})\b', re.IGNORECASE)
+
+# 'breaking ... news' can span other phrases and 'just in' overlaps the 'just'
+# event marker, so those keep separate scans; everything else is fused
+BREAKING_SPAN_PATTERN = re.compile(rf'\b{BREAKING_NEWS_PATTERNS[0]}\b', re.IGNORECASE)
+PHRASE_PATTERN = _fuse_patterns(BREAKING_NEWS_PATTERNS[1:] + VIRAL_PATTERNS)
+EVENT_PATTERN = _fuse_patterns(EVENT_PATTERNS)
+
+def _matches_by_pattern(pattern: re.Pattern, text: str) -> List[List[str]]:
+    """Run a fused pattern once and group matches by the sub-pattern that produced them"""
+    buckets: List[List[str]] = [[] for _ in range(pattern.groups)]
+    for match in pattern.finditer(text):
+        buckets[match.lastindex - 1].append(match.group())
+    return buckets
+
 def tokenize(text: str) -> List[str]:
     """
     Tokenize text into words, removing stop words and normalizing
@@ -90,27 +206,35 @@ def tokenize(text: str) -> List[str]:
     # Convert to lowercase and find words
     words = WORD_PATTERN.findall(cleaned)
 
-    # Filter out stop words, short words, numbers, and HTML-like strings
+    # Filter out stop words, short words, and URL/HTML leftovers. WORD_PATTERN
+    # only yields letters, digits and _'- starting with a letter, so numbers,
+    # brackets and URL punctuation can't occur; only a non-ASCII letter that
+    # case-folds into [a-z] (e.g. 'ı', 'ſ') can leave a token without a-z.
+    stop_words = STOP_WORDS
+    slang = INTERNET_SLANG
     tokens: List[str] = []
     for word in words:
         # basic sanitation
         w = word.strip("_'-")
         if (len(w) >= 3 and
-            w not in STOP_WORDS and
-            not w.isdigit() and
-            not any(char in w for char in '<>{}[]()') and
-            not w.startswith(('http', 'www', 'html', 'src', 'href')) and
-            re.search(r'[a-z]', w)):
+            w not in stop_words and
+            not w.startswith(URL_TOKEN_PREFIXES) and
+            (w.isascii() or ASCII_LETTER_PATTERN.search(w))):
 
             # Normalize internet slang
-            normalized_word = INTERNET_SLANG.get(w, w)
-            # Skip tokens that contain dots/colons/slashes (likely URL parts)
-            if '.' in normalized_word or ':' in normalized_word or '/' in normalized_word:
-                continue
-            tokens.append(normalized_word)
+            tokens.append(slang.get(w, w))
 
     return tokens
 
+def strip_html(text: str) -> str:
+    """Replace HTML tags with spaces"""
+    # A tag has to end at a '>', so text past the last one is left alone;
+    # this keeps a long run of unclosed '<' from rescanning to the end each time
+    end = text.rfind('>') + 1
+    if not end:
+        return text
+    return HTML_PATTERN.sub(' ', text[:end]) + text[end:]
+
 def extract_hashtags(text: str) -> List[str]:
     """Extract hashtags from text"""
     hashtags = HASHTAG_PATTERN.findall(text)
@@ -148,21 +272,25 @@ def extract_urls(text: str) -> List[str]:
 
 def extract_emails(text: str) -> List[str]:
     """Extract email addresses from text"""
+    if '@' not in text:
+        return []
     emails = EMAIL_PATTERN.findall(text)
     return [email.lower() for email in emails]
 
-def extract_keywords(text: str, top_k: int = 10) -> List[tuple]:
+def extract_keywords(text: str, top_k: int = 10, tokens: Optional[List[str]] = None) -> List[tuple]:
     """
     Extract top keywords from text based on frequency
     
     Args:
         text: Input text
         top_k: Number of top keywords to return
+        tokens: Output of tokenize(text), if the caller already has it
         
     Returns:
         List of (keyword, frequency) tuples
     """
-    tokens = tokenize(text)
+    if tokens is None:
+        tokens = tokenize(text)
     
     if not tokens:
         return []
@@ -173,12 +301,13 @@ def extract_keywords(text: str, top_k: int = 10) -> List[tuple]:
     # Return top k keywords
     return word_freq.most_common(top_k)
 
-def extract_entities(text: str) -> List[str]:
+def extract_entities(text: str, tokens: Optional[List[str]] = None) -> List[str]:
     """
     Extract entities from text (hashtags, mentions, keywords)
     
     Args:
         text: Input text
+        tokens: Output of tokenize(text), if the caller already has it
         
     Returns:
         List of extracted entities
@@ -188,8 +317,8 @@ def extract_entities(text: str) -> List[str]:
 
     try:
         # Remove HTML and normalize whitespace
-        clean = HTML_PATTERN.sub(' ', text)
-        clean = re.sub(r'\s+', ' ', clean).strip()
+        clean = strip_html(text)
+        clean = WHITESPACE_PATTERN.sub(' ', clean).strip()
 
         entities = set()
 
@@ -201,29 +330,11 @@ def extract_entities(text: str) -> List[str]:
         entities.update([mention[1:].lower() for mention in mentions if len(mention) > 1])
 
         # Top keywords (include single-occurrence to increase coverage)
-        keywords = extract_keywords(clean, top_k=5)
+        keywords = extract_keywords(clean, top_k=5, tokens=tokens)
         entities.update([keyword.lower() for keyword, freq in keywords if keyword])
 
-        # Simple entity pattern matching for known categories
-        entity_patterns = {
-            'covid': r'(?i)\b(covid|coronavirus|pandemic|vaccine|pfizer|moderna|omicron|delta)\b',
-            'climate': r'(?i)\b(climate|global warming|greenhouse|carbon|emission|greta)\b',
-            'crypto': r'(?i)\b(bitcoin|crypto|blockchain|ethereum|nft|dogecoin|elon)\b',
-            'politics': r'(?i)\b(trump|biden|election|democrat|republican|congress|senate)\b',
-            'tech': r'(?i)\b(apple|google|microsoft|amazon|meta|twitter|tiktok|ai|chatgpt)\b',
-            'sports': r'(?i)\b(nfl|nba|fifa|olympics|superbowl|worldcup|playoff)\b',
-            'entertainment': r'(?i)\b(netflix|disney|marvel|starwars|game of thrones|stranger things)\b'
-        }
-
-        for pattern in entity_patterns.values():
-            for m in re.findall(pattern, clean):
-                # re.findall returns tuples for grouped patterns; normalize
-                if isinstance(m, tuple):
-                    for part in m:
-                        if part:
-                            entities.add(part.lower())
-                else:
-                    entities.add(m.lower())
+        # Known-category keywords in a single scan
+        entities.update(m.lower() for m in ENTITY_KEYWORD_PATTERN.findall(clean))
 
         # Clean and filter entities; allow hyphens and apostrophes
         cleaned_entities = []
@@ -241,12 +352,13 @@ def extract_entities(text: str) -> List[str]:
         logging.error(f"Error extracting entities: {str(e)}")
         return []
 
-def extract_sentiment_indicators(text: str) -> Dict[str, int]:
+def extract_sentiment_indicators(text: str, tokens: Optional[List[str]] = None) -> Dict[str, int]:
     """
     Extract basic sentiment indicators from text
     
     Args:
         text: Input text
+        tokens: Output of tokenize(text), if the caller already has it
         
     Returns:
         Dictionary with positive, negative, and neutral indicators
@@ -254,30 +366,10 @@ def extract_sentiment_indicators(text: str) -> Dict[str, int]:
     if not text:
         return {'positive': 0, 'negative': 0, 'neutral': 0}
     
-    # Simple sentiment word lists
-    positive_words = {
-        'good', 'great', 'excellent', 'amazing', 'awesome', 'fantastic',
-        'love', 'like', 'enjoy', 'happy', 'pleased', 'satisfied',
-        'wonderful', 'brilliant', 'perfect', 'best', 'favorite',
-        'thank', 'thanks', 'grateful', 'appreciate', 'nice',
-        'cool', 'sweet', 'dope', 'fire', 'lit', 'poggers',
-        'based', 'wholesome', 'blessed'
-    }
-    
-    negative_words = {
-        'bad', 'terrible', 'awful', 'horrible', 'disgusting',
-        'hate', 'dislike', 'angry', 'mad', 'furious', 'annoyed',
-        'sad', 'depressed', 'disappointed', 'frustrated',
-        'worst', 'suck', 'sucks', 'stupid', 'dumb', 'idiotic',
-        'cringe', 'toxic', 'trash', 'garbage', 'pathetic',
-        'fail', 'failure', 'disaster', 'nightmare'
-    }
-    
-    text_lower = text.lower()
-    words = set(tokenize(text))
+    words = set(tokenize(text) if tokens is None else tokens)
     
-    positive_count = len(words & positive_words)
-    negative_count = len(words & negative_words)
+    positive_count = len(words & POSITIVE_WORDS)
+    negative_count = len(words & NEGATIVE_WORDS)
     
     # Count exclamation marks and caps as intensity indicators
     exclamation_count = text.count('!')
@@ -311,54 +403,25 @@ def extract_trending_patterns(text: str) -> Dict[str, List[str]]:
     try:
         text_lower = text.lower()
         
-        # Breaking news indicators
-        breaking_patterns = [
-            r'(?i)\bbreaking\b.*\bnews\b',
-            r'(?i)\bjust\s+in\b',
-            r'(?i)\burgent\b',
-            r'(?i)\balert\b',
-            r'(?i)\bupdate\b'
-        ]
+        phrase_matches = _matches_by_pattern(PHRASE_PATTERN, text)
+        breaking_count = len(BREAKING_NEWS_PATTERNS) - 1
         
-        for pattern in breaking_patterns:
-            matches = re.findall(pattern, text)
+        # Breaking news indicators
+        patterns['breaking_news'].extend(BREAKING_SPAN_PATTERN.findall(text))
+        for matches in phrase_matches[:breaking_count]:
             patterns['breaking_news'].extend(matches)
         
         # Viral phrase indicators
-        viral_patterns = [
-            r'(?i)\bgone\s+viral\b',
-            r'(?i)\btrending\b',
-            r'(?i)\bgoing\s+viral\b',
-            r'(?i)\beveryone\s+is\s+talking\b',
-            r'(?i)\binternet\s+is\s+losing\b'
-        ]
-        
-        for pattern in viral_patterns:
-            matches = re.findall(pattern, text)
+        for matches in phrase_matches[breaking_count:]:
             patterns['viral_phrases'].extend(matches)
         
         # Meme references
-        meme_indicators = [
-            'stonks', 'hodl', 'diamond hands', 'to the moon',
-            'this is fine', 'change my mind', 'ok boomer',
-            'big chungus', 'among us', 'sus', 'impostor',
-            'chad', 'karen', 'simp', 'based', 'cringe',
-            'poggers', 'kekw', 'monke', 'bonk'
-        ]
-        
-        for indicator in meme_indicators:
+        for indicator in MEME_INDICATORS:
             if indicator in text_lower:
                 patterns['meme_references'].append(indicator)
         
         # Event markers
-        event_patterns = [
-            r'(?i)\b(today|yesterday|now|just|recently|currently)\b',
-            r'(?i)\b(happening|occurred|announced|revealed|confirmed)\b',
-            r'(?i)\b(live|real\s+time|as\s+we\s+speak)\b'
-        ]
-        
-        for pattern in event_patterns:
-            matches = re.findall(pattern, text)
+        for matches in _matches_by_pattern(EVENT_PATTERN, text):
             patterns['event_markers'].extend(matches)
     
     except Exception as e:
@@ -366,12 +429,17 @@ def extract_trending_patterns(text: str) -> Dict[str, List[str]]:
     
     return patterns
 
-def calculate_engagement_score(text: str) -> float:
+def calculate_engagement_score(text: str, hashtags: Optional[List[str]] = None,
+                               sentiment: Optional[Dict[str, int]] = None,
+                               trending_patterns: Optional[Dict[str, List[str]]] = None) -> float:
     """
     Calculate a simple engagement score based on text features
     
     Args:
         text: Input text
+        hashtags: Output of extract_hashtags(text), if the caller already has it
+        sentiment: Output of extract_sentiment_indicators(text), if the caller already has it
+        trending_patterns: Output of extract_trending_patterns(text), if the caller already has it
         
     Returns:
         Engagement score (0.0 to 1.0)
@@ -390,7 +458,8 @@ def calculate_engagement_score(text: str) -> float:
             score += 0.1
         
         # Hashtag presence
-        hashtags = extract_hashtags(text)
+        if hashtags is None:
+            hashtags = extract_hashtags(text)
         if hashtags:
             score += min(len(hashtags) * 0.1, 0.3)
         
@@ -399,13 +468,15 @@ def calculate_engagement_score(text: str) -> float:
         score += min(question_count * 0.1, 0.2)
         
         # Sentiment indicators
-        sentiment = extract_sentiment_indicators(text)
+        if sentiment is None:
+            sentiment = extract_sentiment_indicators(text)
         if sentiment['positive'] > sentiment['negative']:
             score += 0.1
         
         # Trending patterns
-        patterns = extract_trending_patterns(text)
-        pattern_count = sum(len(v) for v in patterns.values())
+        if trending_patterns is None:
+            trending_patterns = extract_trending_patterns(text)
+        pattern_count = sum(len(v) for v in trending_patterns.values())
         score += min(pattern_count * 0.05, 0.2)
         
         return min(score, 1.0)
@@ -421,13 +492,14 @@ def clean_text(text: str) -> str:
     if not text:
         return ''
     # remove HTML tags
-    text = HTML_PATTERN.sub(' ', text)
+    text = strip_html(text)
     # remove URLs
     text = URL_PATTERN.sub(' ', text)
-    # remove emails
-    text = EMAIL_PATTERN.sub(' ', text)
+    # remove emails (the pattern backtracks badly on long dotted runs, so skip it when it can't match)
+    if '@' in text:
+        text = EMAIL_PATTERN.sub(' ', text)
     # normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = WHITESPACE_PATTERN.sub(' ', text).strip()
     return text
 
 def extract_tokens(text: str) -> List[str]:
@@ -436,14 +508,16 @@ def extract_tokens(text: str) -> List[str]:
     """
     cleaned = clean_text(text).lower()
     tokens = WORD_PATTERN.findall(cleaned)
+    # Same token alphabet as tokenize: dots, slashes and colons can't occur, and
+    # only non-ASCII tokens can be missing an a-z letter
+    stop_words = STOP_WORDS
     filtered = []
     for t in tokens:
         t = t.strip("_' -")
-        # skip if stop word, contains dot/slash/colon (likely url/domain), or no alpha chars
+        # skip if short, stop word, or no a-z chars
         if (len(t) < 3 or
-            t in STOP_WORDS or
-            '.' in t or '/' in t or ':' in t or
-            not re.search(r'[a-z]', t)):
+            t in stop_words or
+            not (t.isascii() or ASCII_LETTER_PATTERN.search(t))):
             continue
         filtered.append(t)
     return filtered
@@ -462,29 +536,72 @@ def extract_features(text: str) -> Dict[str, int]:
         'mentions': mentions
     }
 
+@lru_cache(maxsize=FEATURE_CACHE_SIZE)
+def _extract_all_features(text: str) -> Dict:
+    """Compute the full feature set, running each extractor only once"""
+    try:
+        tokens = tokenize(text)
+        hashtags = extract_hashtags(text)
+        sentiment = extract_sentiment_indicators(text, tokens=tokens)
+        trending_patterns = extract_trending_patterns(text)
+        return {
+            'entities': extract_entities(text, tokens=tokens),
+            'hashtags': hashtags,
+            'mentions': extract_mentions(text),
+            'urls': extract_urls(text),
+            'keywords': extract_keywords(text, tokens=tokens),
+            'sentiment': sentiment,
+            'trending_patterns': trending_patterns,
+            'engagement_score': calculate_engagement_score(
+                text, hashtags=hashtags, sentiment=sentiment, trending_patterns=trending_patterns
+            ),
+            'word_count': len(tokens),
+            'char_count': len(text)
+        }
+    except Exception as e:
+        logging.error(f"Error extracting features: {str(e)}")
+        return {}
+
 def extract_all_features(text: str) -> Dict:
     """
     Extract comprehensive features from text
     
+    Repeated texts (reposts, crossposts) are served from an in-memory cache.
+    
     Args:
         text: Input text
         
     Returns:
         Dictionary containing all extracted features
     """
-    try:
-        return {
-            'entities': extract_entities(text),
-            'hashtags': extract_hashtags(text),
-            'mentions': extract_mentions(text),
-            'urls': extract_urls(text),
-            'keywords': extract_keywords(text),
-            'sentiment': extract_sentiment_indicators(text),
-            'trending_patterns': extract_trending_patterns(text),
-            'engagement_score': calculate_engagement_score(text),
-            'word_count': len(tokenize(text)),
-            'char_count': len(text)
-        }
-    except Exception as e:
-        logging.error(f"Error extracting features: {str(e)}")
-        return {}
+    # Copy so callers can't modify the cached result
+    return copy.deepcopy(_extract_all_features(text))
+
+def extract_entities_batch(texts: List[str]) -> List[List[str]]:
+    """
+    Extract entities for many posts, computing each distinct text once
+    
+    Args:
+        texts: Input texts
+        
+    Returns:
+        List of entity lists, aligned with texts
+    """
+    by_text = {text: extract_entities(text) for text in dict.fromkeys(texts)}
+    return [list(by_text[text]) for text in texts]
+
+def extract_all_features_batch(texts: List[str]) -> Dict[str, list]:
+    """
+    Extract comprehensive features for many posts in columnar form
+    
+    Args:
+        texts: Input texts
+        
+    Returns:
+        Dictionary mapping each feature name to a list of values aligned with texts
+    """
+    # Repeated texts are served from the extract_all_features cache
+    rows = [extract_all_features(text) for text in texts]
+    # Rows that failed extraction come back empty and get None in every column
+    names = next((row.keys() for row in rows if row), ())
+    return {name: [row.get(name) for row in rows] for name in names}
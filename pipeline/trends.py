@@ -18,30 +18,37 @@ class TrendAnalyzer:
         self.window_hours = int(os.getenv('TREND_WINDOW_HOURS', 24))
         self.baseline_hours = int(os.getenv('TREND_BASELINE_HOURS', 168))  # 7 days
     
-    def get_entity_counts(self, hours_back: int = 24) -> pd.DataFrame:
+    def get_entity_counts(self, hours_back: int = 24, current_hours: Optional[int] = None) -> pd.DataFrame:
         """
         Get entity mention counts for the specified time period
         
         Args:
             hours_back: How many hours back to look
+            current_hours: Optional shorter window; when set, counts are split so
+                rows also carry an in_current flag for posts inside it
             
         Returns:
             DataFrame with entity counts
         """
         try:
+            current_flag = (
+                "datetime(created_at) > datetime('now', '-{} hours')".format(current_hours)
+                if current_hours is not None else "0"
+            )
             query = """
             SELECT 
                 entities,
                 platform,
                 created_at,
+                {flag} as in_current,
                 COUNT(*) as post_count
             FROM posts 
             WHERE datetime(created_at) > datetime('now', '-{} hours')
             AND entities IS NOT NULL
             AND entities != ''
-            GROUP BY entities, platform, DATE(created_at)
+            GROUP BY entities, platform, DATE(created_at), in_current
             ORDER BY created_at DESC
-            """.format(hours_back)
+            """.format(hours_back, flag=current_flag)
             
             df = pd.read_sql(query, self.engine)
             
@@ -59,6 +66,7 @@ class TrendAnalyzer:
                             'entity': entity,
                             'platform': row['platform'],
                             'created_at': row['created_at'],
+                            'in_current': bool(row['in_current']),
                             'post_count': row['post_count']
                         })
             
@@ -86,15 +94,25 @@ class TrendAnalyzer:
             DataFrame with trend scores
         """
         try:
-            # Get current period data
-            current_df = self.get_entity_counts(current_hours)
-            if current_df.empty:
-                return pd.DataFrame()
-            
-            # Get baseline period data
-            baseline_df = self.get_entity_counts(baseline_hours)
-            if baseline_df.empty:
-                return current_df  # Return current data without trend scores
+            if baseline_hours >= current_hours:
+                # The current window lies inside the baseline, so read posts once and split
+                baseline_df = self.get_entity_counts(baseline_hours, current_hours=current_hours)
+                if baseline_df.empty:
+                    return pd.DataFrame()
+                
+                current_df = baseline_df[baseline_df['in_current']]
+                if current_df.empty:
+                    return pd.DataFrame()
+            else:
+                # Get current period data
+                current_df = self.get_entity_counts(current_hours)
+                if current_df.empty:
+                    return pd.DataFrame()
+                
+                # Get baseline period data
+                baseline_df = self.get_entity_counts(baseline_hours)
+                if baseline_df.empty:
+                    return current_df  # Return current data without trend scores
             
             # Aggregate counts by entity and platform
             current_counts = current_df.groupby(['entity', 'platform'])['post_count'].sum().reset_index()
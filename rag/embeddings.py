@@ -6,6 +6,7 @@ import logging
 # Try to import ML libraries, fallback if not available
 try:
     from sentence_transformers import SentenceTransformer
+    import torch
     HAS_SENTENCE_TRANSFORMERS = True
 except ImportError:
     HAS_SENTENCE_TRANSFORMERS = False
@@ -14,8 +15,10 @@ except ImportError:
 class EmbeddingManager:
     """Manages text embeddings using sentence-transformers"""
     
-    def __init__(self, model_name: str = None):
+    def __init__(self, model_name: str = None, quantize: bool = False):
         self.model_name = model_name or os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+        # Opt-in int8 dynamic quantization of Linear layers when running on CPU
+        self.quantize = quantize
         self.model = None
         self.embedding_dim = None
         self._load_model()
@@ -25,6 +28,11 @@ class EmbeddingManager:
         try:
             if HAS_SENTENCE_TRANSFORMERS:
                 self.model = SentenceTransformer(self.model_name)
+                if self.quantize and self.model.device.type == 'cpu':
+                    self.model = torch.ao.quantization.quantize_dynamic(
+                        self.model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                    logging.info(f"Quantized embedding model to int8: {self.model_name}")
                 # Get embedding dimension
                 test_embedding = self.model.encode(["test"])
                 self.embedding_dim = test_embedding.shape[1]
@@ -207,12 +215,14 @@ class EmbeddingManager:
 # Global embedding manager instance
 _embedding_manager = None
 
-def get_embedding_manager(model_name: str = None) -> EmbeddingManager:
+def get_embedding_manager(model_name: str = None, quantize: bool = False) -> EmbeddingManager:
     """Get or create global embedding manager instance"""
     global _embedding_manager
     
-    if _embedding_manager is None or (model_name and model_name != _embedding_manager.model_name):
-        _embedding_manager = EmbeddingManager(model_name)
+    if (_embedding_manager is None
+            or (model_name and model_name != _embedding_manager.model_name)
+            or quantize != _embedding_manager.quantize):
+        _embedding_manager = EmbeddingManager(model_name, quantize=quantize)
     
     return _embedding_manager
 
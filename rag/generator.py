@@ -14,9 +14,11 @@ except ImportError:
 class RAGGenerator:
     """Text generation component for RAG system"""
     
-    def __init__(self, model_name: str = None, device: str = None):
+    def __init__(self, model_name: str = None, device: str = None, quantize: bool = False):
         self.model_name = model_name or os.getenv('GEN_MODEL', 'google/flan-t5-base')
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
+        # Opt-in int8 dynamic quantization of Linear layers when running on CPU
+        self.quantize = quantize
         
         self.tokenizer = None
         self.model = None
@@ -39,6 +41,11 @@ class RAGGenerator:
                 # Move to device
                 if self.device == 'cuda' and torch.cuda.is_available():
                     self.model = self.model.to(self.device)
+                elif self.quantize:
+                    self.model = torch.ao.quantization.quantize_dynamic(
+                        self.model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                    logging.info(f"Quantized generation model to int8: {self.model_name}")
                 
                 # Create pipeline
                 self.pipeline = pipeline(
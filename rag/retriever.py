@@ -18,13 +18,14 @@ from .embeddings import get_embedding_manager
 class RAGRetriever:
     """Retrieval component for RAG system using ChromaDB"""
     
-    def __init__(self, chroma_path: str = None, embedding_model: str = None, collection_name: str = "social_context"):
+    def __init__(self, chroma_path: str = None, embedding_model: str = None, collection_name: str = "social_context",
+                 quantize: bool = False):
         self.chroma_path = chroma_path or os.getenv('CHROMA_PATH', './data/chroma')
         self.embedding_model = embedding_model or os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
         self.collection_name = collection_name
         
         # Initialize embedding manager
-        self.embedding_manager = get_embedding_manager(self.embedding_model)
+        self.embedding_manager = get_embedding_manager(self.embedding_model, quantize=quantize)
         
         # Initialize ChromaDB client
         self.client = None
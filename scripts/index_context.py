@@ -284,7 +284,8 @@ def main():
     try:
         retriever = RAGRetriever(
             chroma_path=config.get('CHROMA_PATH', './data/chroma'),
-            embedding_model=config.get('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+            embedding_model=config.get('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2'),
+            quantize=config.get('QUANTIZE_MODELS', False)
         )
         logging.info("✅ RAG retriever initialized")
     except Exception as e:
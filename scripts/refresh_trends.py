@@ -189,8 +189,9 @@ def check_for_alerts(threshold: float = 2.0) -> dict:
             logging.info("Alerts are disabled")
             return alert_results
         
-        # Send alerts for qualifying trends
+        # Collect alerts for qualifying trends
         notifier = get_notifier()
+        pending_alerts = []
         
         for _, trend in high_trends.iterrows():
             trend_data = {
@@ -211,18 +212,23 @@ def check_for_alerts(threshold: float = 2.0) -> dict:
             else:
                 alert_type = "moderate_trend"
             
-            try:
-                success = notifier.send_trend_alert(trend_data, alert_type)
-                if success:
-                    alert_results['alerts_sent'] += 1
-                    logging.info(f"✅ Alert sent for {trend['entity']}")
-                else:
-                    alert_results['alert_failures'] += 1
-                    logging.warning(f"⚠️ Failed to send alert for {trend['entity']}")
-            
-            except Exception as e:
+            pending_alerts.append((trend_data, alert_type))
+        
+        # Send the whole batch so emails share a single SMTP session
+        try:
+            sent_flags = notifier.send_trend_alerts(pending_alerts)
+        except Exception as e:
+            alert_results['alert_failures'] += len(pending_alerts)
+            logging.error(f"❌ Error sending alerts: {str(e)}")
+            return alert_results
+        
+        for (trend_data, _), success in zip(pending_alerts, sent_flags):
+            if success:
+                alert_results['alerts_sent'] += 1
+                logging.info(f"✅ Alert sent for {trend_data['entity']}")
+            else:
                 alert_results['alert_failures'] += 1
-                logging.error(f"❌ Error sending alert for {trend['entity']}: {str(e)}")
+                logging.warning(f"⚠️ Failed to send alert for {trend_data['entity']}")
         
         return alert_results
         
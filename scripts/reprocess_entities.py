@@ -10,7 +10,9 @@ from sqlalchemy import text as sql_text
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database.schema import get_engine
-from pipeline.features import extract_entities
+from pipeline.features import extract_entities, extract_entities_batch
+
+UPDATE_ENTITIES_STATEMENT = sql_text("UPDATE posts SET entities = :entities WHERE id = :id")
 
 
 def setup_logging():
@@ -33,23 +35,27 @@ def main(batch_size: int = 500):
     # Process in batches
     for i in range(0, total, batch_size):
         batch = rows[i:i+batch_size]
-        updates = []
-        for row in batch:
-            # SQLAlchemy Row may not support dict-like access depending on driver; use index access
-            post_id = row[0]
-            post_text = row[1]
-            try:
-                entities = extract_entities(post_text)
-                entities_str = ','.join(entities)
-                updates.append({'id': post_id, 'entities': entities_str})
-            except Exception as e:
-                logging.warning(f"Failed to extract entities for post {post_id}: {e}")
+        # SQLAlchemy Row may not support dict-like access depending on driver; use index access
+        try:
+            entities_batch = extract_entities_batch([row[1] for row in batch])
+            updates = [
+                {'id': row[0], 'entities': ','.join(entities)}
+                for row, entities in zip(batch, entities_batch)
+            ]
+        except Exception as e:
+            # Fall back to one post at a time so a bad post only skips itself
+            logging.warning(f"Batch entity extraction failed for posts {i}-{i + len(batch)}, retrying per post: {e}")
+            updates = []
+            for row in batch:
+                try:
+                    updates.append({'id': row[0], 'entities': ','.join(extract_entities(row[1]))})
+                except Exception as post_error:
+                    logging.warning(f"Failed to extract entities for post {row[0]}: {post_error}")
 
         # Apply updates in a transaction
         if updates:
             with engine.begin() as conn:
-                for u in updates:
-                    conn.execute(sql_text("UPDATE posts SET entities = :entities WHERE id = :id"), u)
+                conn.execute(UPDATE_ENTITIES_STATEMENT, updates)
             updated += len(updates)
             logging.info(f"Updated {updated}/{total} posts")
 
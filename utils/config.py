@@ -35,6 +35,7 @@ class Config:
             # AI Models
             'EMBEDDING_MODEL': os.getenv('EMBEDDING_MODEL'),
             'GEN_MODEL': os.getenv('GEN_MODEL'),
+            'QUANTIZE_MODELS': os.getenv('QUANTIZE_MODELS'),
             
             # Optional: OpenAI
             'OPENAI_API_KEY': os.getenv('OPENAI_API_KEY'),
@@ -107,6 +108,7 @@ class Config:
             # AI Models
             'EMBEDDING_MODEL': 'sentence-transformers/all-MiniLM-L6-v2',
             'GEN_MODEL': 'google/flan-t5-base',
+            'QUANTIZE_MODELS': 'false',
             
             # Reddit
             'REDDIT_USER_AGENT': 'social-rag-trends/1.0',
@@ -149,6 +151,12 @@ class Config:
                     }
                     self.config[key] = defaults[key]
         
+        # Convert boolean flags
+        bool_keys = ['QUANTIZE_MODELS']
+        for key in bool_keys:
+            if key in self.config:
+                self.config[key] = str(self.config[key]).strip().lower() in ('1', 'true', 'yes')
+        
         # Validate paths exist (create if needed)
         path_keys = ['DB_PATH', 'CHROMA_PATH']
         for key in path_keys:
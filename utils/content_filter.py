@@ -3,6 +3,41 @@ import logging
 from typing import Dict, List, Set, Any
 from collections import Counter
 import string
+import numpy as np
+
+# Patterns shared by every check, compiled once at import
+WORD_PATTERN = re.compile(r'\b\w+\b')
+URL_PATTERN = re.compile(r'https?://')
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+NON_WORD_PATTERN = re.compile(r'[^\w]')
+
+CODED_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\b13\s*%\b',  # Race-related statistics
+    r'\b13\s*50\b',  # Crime statistics dogwhistle
+    r'\b6\s*million\b',  # Holocaust denial
+    r'\(((\(|\[)?\w+(\)|\])?)\)',  # Echo parentheses
+))
+
+CONSPIRACY_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(?i)\b(they|them)\s+(control|want|don\'t want)',
+    r'(?i)\b(cover.?up|hiding|suppressing)\b',
+    r'(?i)\b(follow the money|cui bono)\b',
+    r'(?i)\b(question everything|think for yourself)\b.*\b(sheep|sheeple)\b'
+))
+
+SEXUAL_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(?i)\b(send|show).*\b(nudes?|pics?)\b',
+    r'(?i)\b(hook\s*up|netflix and chill)\b',
+    r'(?i)\b(18\+|nsfw|not safe for work)\b',
+    r'(?i)\b(xxx|adult content|mature)\b'
+))
+
+NSFW_WORDS = frozenset({
+    'sex', 'porn', 'nude', 'naked', 'orgasm', 'masturbate',
+    'dildo', 'vibrator', 'bondage', 'bdsm', 'fetish',
+    'strip', 'stripper', 'escort', 'prostitute', 'hooker',
+    'onlyfans', 'premium snap', 'sugar daddy', 'sugar baby'
+})
 
 class ContentFilter:
     """Content safety and quality filtering system"""
@@ -66,7 +101,7 @@ class ContentFilter:
     
     def check_profanity(self, text: str) -> Dict[str, Any]:
         """Check for profanity in text"""
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = WORD_PATTERN.findall(text.lower())
         found_profanity = [word for word in words if word in self.profanity_words]
         
         return {
@@ -84,7 +119,7 @@ class ContentFilter:
                 matches.append(pattern.pattern)
         
         # Additional spam indicators
-        url_count = len(re.findall(r'https?://', text))
+        url_count = len(URL_PATTERN.findall(text))
         caps_ratio = sum(1 for c in text if c.isupper()) / max(len(text), 1)
         exclamation_count = text.count('!')
         
@@ -115,16 +150,9 @@ class ContentFilter:
                 found_indicators.append(indicator)
         
         # Check for slur variations and coded language
-        coded_patterns = [
-            r'\b13\s*%\b',  # Race-related statistics
-            r'\b13\s*50\b',  # Crime statistics dogwhistle
-            r'\b6\s*million\b',  # Holocaust denial
-            r'\(((\(|\[)?\w+(\)|\])?)\)',  # Echo parentheses
-        ]
-        
-        for pattern in coded_patterns:
-            if re.search(pattern, text_lower):
-                found_indicators.append(f"coded_language:{pattern}")
+        for pattern in CODED_PATTERNS:
+            if pattern.search(text_lower):
+                found_indicators.append(f"coded_language:{pattern.pattern}")
         
         severity = 'high' if len(found_indicators) >= 2 else 'medium' if found_indicators else 'none'
         
@@ -144,16 +172,9 @@ class ContentFilter:
                 found_flags.append(flag)
         
         # Check for conspiracy theory patterns
-        conspiracy_patterns = [
-            r'(?i)\b(they|them)\s+(control|want|don\'t want)',
-            r'(?i)\b(cover.?up|hiding|suppressing)\b',
-            r'(?i)\b(follow the money|cui bono)\b',
-            r'(?i)\b(question everything|think for yourself)\b.*\b(sheep|sheeple)\b'
-        ]
-        
         pattern_matches = []
-        for pattern in conspiracy_patterns:
-            if re.search(pattern, text):
+        for pattern in CONSPIRACY_PATTERNS:
+            if pattern.search(text):
                 pattern_matches.append('conspiracy_pattern')
         
         total_flags = len(found_flags) + len(pattern_matches)
@@ -167,27 +188,13 @@ class ContentFilter:
     
     def check_nsfw(self, text: str) -> Dict[str, Any]:
         """Check for NSFW (Not Safe For Work) content"""
-        nsfw_words = {
-            'sex', 'porn', 'nude', 'naked', 'orgasm', 'masturbate',
-            'dildo', 'vibrator', 'bondage', 'bdsm', 'fetish',
-            'strip', 'stripper', 'escort', 'prostitute', 'hooker',
-            'onlyfans', 'premium snap', 'sugar daddy', 'sugar baby'
-        }
-        
-        words = re.findall(r'\b\w+\b', text.lower())
-        found_nsfw = [word for word in words if word in nsfw_words]
+        words = WORD_PATTERN.findall(text.lower())
+        found_nsfw = [word for word in words if word in NSFW_WORDS]
         
         # Check for sexual content patterns
-        sexual_patterns = [
-            r'(?i)\b(send|show).*\b(nudes?|pics?)\b',
-            r'(?i)\b(hook\s*up|netflix and chill)\b',
-            r'(?i)\b(18\+|nsfw|not safe for work)\b',
-            r'(?i)\b(xxx|adult content|mature)\b'
-        ]
-        
         pattern_matches = 0
-        for pattern in sexual_patterns:
-            if re.search(pattern, text):
+        for pattern in SEXUAL_PATTERNS:
+            if pattern.search(text):
                 pattern_matches += 1
         
         nsfw_score = len(found_nsfw) + pattern_matches
@@ -243,7 +250,7 @@ class ContentFilter:
             score -= 15
         
         # Sentence structure
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+        sentences = [s.strip() for s in SENTENCE_SPLIT_PATTERN.split(text) if s.strip()]
         if sentences:
             avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences)
             if avg_sentence_length < 3:
@@ -322,6 +329,25 @@ class ContentFilter:
             'recommendation': self._get_recommendation(flags, overall_score)
         }
     
+    def filter_content_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Check a batch of texts for safety in one pass
+        
+        Args:
+            texts: Texts to check
+        
+        Returns:
+            Boolean array, True where the text is safe
+        """
+        verdicts = {}
+        mask = np.empty(len(texts), dtype=bool)
+        for i, text in enumerate(texts):
+            verdict = verdicts.get(text)
+            if verdict is None:
+                verdict = verdicts[text] = self.filter_content(text)['is_safe']
+            mask[i] = verdict
+        return mask
+    
     def _get_recommendation(self, flags: List[str], score: int) -> str:
         """Get content recommendation based on analysis"""
         if not flags and score >= 80:
@@ -345,7 +371,7 @@ class ContentFilter:
             words = text.split()
             safe_words = []
             for word in words:
-                clean_word = re.sub(r'[^\w]', '', word.lower())
+                clean_word = NON_WORD_PATTERN.sub('', word.lower())
                 if clean_word in self.profanity_words:
                     safe_words.append('*' * len(word))
                 else:
@@ -373,6 +399,11 @@ def filter_content(text: str) -> Dict[str, Any]:
     content_filter = get_content_filter()
     return content_filter.filter_content(text)
 
+def filter_content_batch(texts: List[str]) -> np.ndarray:
+    """Convenience function to get a safety mask for many texts"""
+    content_filter = get_content_filter()
+    return content_filter.filter_content_batch(texts)
+
 def is_content_safe(text: str) -> bool:
     """Quick check if content is safe"""
     result = filter_content(text)
@@ -1,8 +1,57 @@
 """Database utilities for the application"""
 from sqlalchemy import text
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import logging
 
+# Bumped whenever trends are recomputed in this process. Cached trend loaders
+# take it as an argument, so a refresh invalidates exactly their entries.
+_trends_generation = 0
+
+def trends_generation():
+    """Current trends generation, passed to cached trend loaders as part of their key"""
+    return _trends_generation
+
+def bump_trends_generation():
+    """Invalidate cached trend queries after trends have been recomputed"""
+    global _trends_generation
+    _trends_generation += 1
+
+def read_frame(query, engine, params=None):
+    """
+    Run a query and build a DataFrame straight from the fetched rows
+    
+    Args:
+        query: SQLAlchemy text() query
+        engine: SQLAlchemy engine or connection
+        params: Optional dict of bound parameters
+    
+    Returns:
+        DataFrame with one column per selected field
+    """
+    with engine.connect() as conn:
+        result = conn.execute(query, params or {})
+        return pd.DataFrame.from_records(result.fetchall(), columns=list(result.keys()))
+
+def split_csv_column(values):
+    """
+    Split a comma-joined text column into an Arrow list<string> column
+    
+    Args:
+        values: Series of comma-separated strings (e.g. hashtags, entities)
+    
+    Returns:
+        Series of string lists; empty or missing values become empty lists
+    """
+    arr = pa.array(values.fillna(''), pa.string())
+    lists = pc.if_else(
+        pc.equal(arr, ''),
+        pa.scalar([], pa.list_(pa.string())),
+        pc.split_pattern(arr, ',')
+    )
+    return pd.Series(pd.arrays.ArrowExtensionArray(lists), index=values.index, name=values.name)
+
 def get_quick_stats(engine):
     """Get quick statistics about posts and trends"""
     try: